@@ -0,0 +1,43 @@
+"""
+Token bucket refill kernel, JIT-compiled with Numba when available.
+[CTX:PBI-0:0-3:RL]
+
+The refill step is pure float arithmetic, so it can be compiled for callers
+that refill in tight loops (bulk replay, backtesting). Without numba the
+pure-Python kernel is used; both return identical results.
+"""
+from typing import Tuple
+
+
+def refill_python(
+    tokens: float,
+    last: float,
+    now: float,
+    rate: float,
+    capacity: float
+) -> Tuple[float, float]:
+    """
+    Compute refilled token count.
+    
+    Args:
+        tokens: Current token count
+        last: Time of the previous refill
+        now: Current time
+        rate: Refill rate (tokens per second)
+        capacity: Maximum tokens in bucket
+    
+    Returns:
+        Tuple of (new token count, new last-refill time)
+    """
+    elapsed = now - last
+    return min(capacity, tokens + rate * elapsed), now
+
+
+try:
+    from numba import njit
+except ImportError:
+    NUMBA_AVAILABLE = False
+    refill_numba = None
+else:
+    NUMBA_AVAILABLE = True
+    refill_numba = njit(cache=True)(refill_python)
@@ -2,10 +2,28 @@
 Configuration loader and validator for exchange rate limit settings.
 [CTX:PBI-0:0-2:CFG]
 """
+import functools
+import logging
+import sys
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-import yaml
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Sequence, Tuple, Union
 
+logger = logging.getLogger(__name__)
+
+# Resolved on first load_config() so importing this module doesn't pull in
+# PyYAML; see _get_yaml_loader()
+_yaml_loader: Optional[type] = None
+
+
+# Standard rate limit header names, built once and shared read-only
+_DEFAULT_HEADERS = MappingProxyType({
+    "retry_after": "Retry-After",
+    "limit": "X-RateLimit-Limit",
+    "remaining": "X-RateLimit-Remaining",
+    "reset": "X-RateLimit-Reset",
+})
 
 # Default configuration used as fallback
 DEFAULT_CONFIG = {
@@ -15,12 +33,7 @@ DEFAULT_CONFIG = {
             "steady_rate": 10,
             "burst": 20,
             "max_concurrency": 4,
-            "headers": {
-                "retry_after": "Retry-After",
-                "limit": "X-RateLimit-Limit",
-                "remaining": "X-RateLimit-Remaining",
-                "reset": "X-RateLimit-Reset",
-            },
+            "headers": dict(_DEFAULT_HEADERS),
             "buckets": []
         }
     }
@@ -32,39 +45,68 @@ class ConfigValidationError(Exception):
     pass
 
 
+def _intern_str(value: Any) -> Any:
+    """Intern strings (YAML may also yield ints etc., returned unchanged)."""
+    return sys.intern(value) if type(value) is str else value
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively turn dicts into read-only mappings and lists into tuples."""
+    if isinstance(value, Mapping):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple([_freeze(v) for v in value])
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Inverse of _freeze: plain dicts and lists for serialization."""
+    if isinstance(value, Mapping):
+        return {k: _thaw(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(v) for v in value]
+    return value
+
+
+# Config instances are shared by the load_config and get_default_config
+# caches, so their containers are frozen too: headers and exchanges are
+# read-only mappings, buckets a tuple of them. eq=False keeps equality and
+# hashing by identity, since those fields are not hashable
+@dataclass(slots=True, frozen=True, eq=False)
 class ExchangeConfig:
     """Represents configuration for a single exchange."""
     
-    def __init__(
-        self,
-        host: str,
-        steady_rate: int = 10,
-        burst: int = 20,
-        max_concurrency: int = 4,
-        headers: Optional[Dict[str, str]] = None,
-        buckets: Optional[List[Dict[str, Any]]] = None
-    ):
-        self.host = host
-        self.steady_rate = steady_rate
-        self.burst = burst
-        self.max_concurrency = max_concurrency
-        self.headers = headers or {
-            "retry_after": "Retry-After",
-            "limit": "X-RateLimit-Limit",
-            "remaining": "X-RateLimit-Remaining",
-            "reset": "X-RateLimit-Reset",
-        }
-        self.buckets = buckets or []
+    host: str
+    steady_rate: int = 10
+    burst: int = 20
+    max_concurrency: int = 4
+    headers: Optional[Mapping[str, str]] = None
+    buckets: Optional[Sequence[Mapping[str, Any]]] = None
+    
+    def __post_init__(self) -> None:
+        if not self.headers:
+            object.__setattr__(self, "headers", _DEFAULT_HEADERS)
+        elif self.headers is not _DEFAULT_HEADERS:
+            # Copy: a proxy passed in may still wrap the caller's dict
+            object.__setattr__(self, "headers", MappingProxyType(dict(self.headers)))
+        object.__setattr__(self, "buckets", _freeze(self.buckets or ()))
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ExchangeConfig":
         """Create ExchangeConfig from dictionary."""
+        # Host and header names repeat across exchanges; intern them so
+        # duplicates share one object and compare by identity first
+        headers = data.get("headers")
+        if headers:
+            headers = {
+                _intern_str(k): _intern_str(v) for k, v in headers.items()
+            }
         return cls(
-            host=data.get("host", "api.example.com"),
+            host=_intern_str(data.get("host", "api.example.com")),
             steady_rate=data.get("steady_rate", 10),
             burst=data.get("burst", 20),
             max_concurrency=data.get("max_concurrency", 4),
-            headers=data.get("headers"),
+            headers=headers,
             buckets=data.get("buckets")
         )
     
@@ -75,16 +117,21 @@ class ExchangeConfig:
             "steady_rate": self.steady_rate,
             "burst": self.burst,
             "max_concurrency": self.max_concurrency,
-            "headers": self.headers,
-            "buckets": self.buckets
+            "headers": dict(self.headers),
+            "buckets": _thaw(self.buckets)
         }
 
 
+@dataclass(slots=True, frozen=True, eq=False)
 class LimitsConfig:
     """Main configuration container for all exchanges."""
     
-    def __init__(self, exchanges: Dict[str, ExchangeConfig]):
-        self.exchanges = exchanges
+    exchanges: Mapping[str, ExchangeConfig]
+    # Set by load_config once the source data passed validate_config
+    _validated: bool = field(init=False, repr=False, compare=False, default=False)
+    
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "exchanges", MappingProxyType(dict(self.exchanges)))
     
     def get_exchange(self, name: str) -> Optional[ExchangeConfig]:
         """Get configuration for a specific exchange."""
@@ -97,14 +144,15 @@ class LimitsConfig:
     @staticmethod
     def _get_default_config() -> ExchangeConfig:
         """Get default exchange configuration."""
-        return ExchangeConfig.from_dict(DEFAULT_CONFIG["exchanges"]["default"])
+        return get_default_config().exchanges["default"]
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "LimitsConfig":
         """Create LimitsConfig from dictionary."""
         exchanges_data = data.get("exchanges", {})
+        exchange_from_dict = ExchangeConfig.from_dict
         exchanges = {
-            name: ExchangeConfig.from_dict(config)
+            name: exchange_from_dict(config)
             for name, config in exchanges_data.items()
         }
         return cls(exchanges=exchanges)
@@ -119,13 +167,72 @@ class LimitsConfig:
         }
 
 
-def validate_config(config_data: Dict[str, Any]) -> None:
+# JSON Schema mirroring _validate_structure; at least as strict, so a
+# config it accepts is always accepted by the hand-written checks too
+_CONFIG_SCHEMA = {
+    "type": "object",
+    "required": ["exchanges"],
+    "properties": {
+        "exchanges": {
+            "type": "object",
+            "additionalProperties": {
+                "type": "object",
+                "required": ["host"],
+                "properties": {
+                    "steady_rate": {"type": "number", "exclusiveMinimum": 0},
+                    "burst": {"type": "number", "exclusiveMinimum": 0},
+                    "max_concurrency": {"type": "number", "exclusiveMinimum": 0},
+                    "headers": {"type": "object"},
+                    "buckets": {
+                        "type": "array",
+                        "items": {"type": "object", "required": ["key"]},
+                    },
+                },
+            },
+        },
+    },
+}
+
+try:
+    import fastjsonschema
+except ImportError:
+    _schema_validator = None
+else:
+    _schema_validator = fastjsonschema.compile(_CONFIG_SCHEMA)
+
+
+def validate_config(config_data: Union[Dict[str, Any], LimitsConfig]) -> None:
     """
     Validate configuration data structure.
     
+    A LimitsConfig produced by load_config has already been validated and
+    returns immediately; any other LimitsConfig is checked via to_dict().
+    
+    When fastjsonschema is installed, a compiled schema handles the
+    common valid case; anything it rejects is re-checked by the
+    hand-written validator, which decides the outcome and the message.
+    
     Raises:
         ConfigValidationError: If validation fails
     """
+    if isinstance(config_data, LimitsConfig):
+        if config_data._validated:
+            return
+        config_data = config_data.to_dict()
+    
+    if _schema_validator is not None:
+        try:
+            _schema_validator(config_data)
+        except fastjsonschema.JsonSchemaException:
+            pass
+        else:
+            return
+    
+    _validate_structure(config_data)
+
+
+def _validate_structure(config_data: Dict[str, Any]) -> None:
+    """Hand-written structural checks with specific error messages."""
     if not isinstance(config_data, dict):
         raise ConfigValidationError("Config must be a dictionary")
     
@@ -149,12 +256,12 @@ def validate_config(config_data: Dict[str, Any]) -> None:
             )
         
         # Validate numeric fields are positive
-        for field in ["steady_rate", "burst", "max_concurrency"]:
-            if field in exchange_config:
-                value = exchange_config[field]
+        for field_name in ["steady_rate", "burst", "max_concurrency"]:
+            if field_name in exchange_config:
+                value = exchange_config[field_name]
                 if not isinstance(value, (int, float)) or value <= 0:
                     raise ConfigValidationError(
-                        f"Exchange '{exchange_name}' field '{field}' must be a positive number"
+                        f"Exchange '{exchange_name}' field '{field_name}' must be a positive number"
                     )
         
         # Validate headers if present
@@ -184,10 +291,47 @@ def validate_config(config_data: Dict[str, Any]) -> None:
                     )
 
 
+def _get_yaml_loader() -> type:
+    """Resolve and memoize the fastest available safe YAML loader."""
+    global _yaml_loader
+    if _yaml_loader is None:
+        import yaml
+        # libyaml-backed loader is ~10x faster than the pure-Python scanner
+        _yaml_loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return _yaml_loader
+
+
+def _json_loads(raw: bytes) -> Any:
+    """Parse JSON bytes with orjson when installed, else the stdlib."""
+    try:
+        import orjson
+    except ImportError:
+        import json
+        return json.loads(raw)
+    return orjson.loads(raw)
+
+
+# Parsed configs keyed by resolved path; each entry remembers the file's
+# (mtime_ns, size) so an edited file is reparsed on the next load
+_config_cache: Dict[str, Tuple[Tuple[int, ...], LimitsConfig]] = {}
+
+
+def clear_config_cache() -> None:
+    """Drop all cached results of load_config."""
+    _config_cache.clear()
+
+
 def load_config(config_path: Optional[Path] = None) -> LimitsConfig:
     """
     Load and validate configuration from YAML file.
     
+    If a ``.json`` sibling of the file exists and is at least as new
+    (e.g. ``limits.json`` next to ``limits.yml``), it is parsed instead;
+    JSON parsing is much cheaper than YAML. A stale sibling is ignored.
+    
+    Results are cached per file and reused until its mtime or size
+    changes; the returned instance is shared and read-only.
+    
     Args:
         config_path: Path to config file. If None, uses default location.
     
@@ -197,26 +341,88 @@ def load_config(config_path: Optional[Path] = None) -> LimitsConfig:
     Raises:
         ConfigValidationError: If validation fails
     """
+    import yaml
+    
     if config_path is None:
         # Default to config/limits.yml in project root
         config_path = Path(__file__).parent.parent.parent.parent / "config" / "limits.yml"
     
     try:
-        with open(config_path, "r") as f:
-            config_data = yaml.safe_load(f)
+        resolved = Path(config_path).resolve()
+        stat = resolved.stat()
     except FileNotFoundError:
         # Return default config if file not found
-        return LimitsConfig.from_dict(DEFAULT_CONFIG)
-    except yaml.YAMLError as e:
-        raise ConfigValidationError(f"Invalid YAML in config file: {e}")
+        return get_default_config()
+    
+    # Prefer a precompiled JSON sibling unless it is older than the source
+    json_path = resolved.with_suffix(".json")
+    json_stat = None
+    if json_path != resolved:
+        try:
+            json_stat = json_path.stat()
+        except OSError:
+            pass
+        else:
+            if json_stat.st_mtime_ns < stat.st_mtime_ns:
+                json_stat = None
+    
+    cache_key = str(resolved)
+    stamp: Tuple[int, ...] = (stat.st_mtime_ns, stat.st_size)
+    if json_stat is not None:
+        stamp += (json_stat.st_mtime_ns, json_stat.st_size)
+    cached = _config_cache.get(cache_key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    
+    if json_stat is not None:
+        try:
+            raw_json = json_path.read_bytes()
+        except OSError as e:
+            # Unreadable sibling: the YAML source is still authoritative
+            logger.warning(
+                "[CTX:PBI-0:0-2:CFG] Cannot read %s, loading %s instead: %s",
+                json_path, resolved, e,
+            )
+            json_stat = None
+        else:
+            logger.debug(
+                "[CTX:PBI-0:0-2:CFG] Loading precompiled config %s", json_path
+            )
+            try:
+                config_data = _json_loads(raw_json)
+            except ValueError as e:
+                raise ConfigValidationError(f"Invalid JSON in config file: {e}")
+    
+    if json_stat is None:
+        try:
+            # libyaml scans one contiguous buffer instead of a text stream;
+            # a blank file skips the parser and fails validation below
+            raw = resolved.read_bytes()
+            config_data = (
+                yaml.load(raw, Loader=_get_yaml_loader()) if raw.strip() else None
+            )
+        except FileNotFoundError:
+            # Return default config if file not found
+            return get_default_config()
+        except yaml.YAMLError as e:
+            raise ConfigValidationError(f"Invalid YAML in config file: {e}")
     
     # Validate the loaded config
     validate_config(config_data)
     
-    return LimitsConfig.from_dict(config_data)
+    config = LimitsConfig.from_dict(config_data)
+    object.__setattr__(config, "_validated", True)
+    _config_cache[cache_key] = (stamp, config)
+    return config
 
 
+@functools.lru_cache(maxsize=1)
 def get_default_config() -> LimitsConfig:
-    """Get default configuration."""
+    """
+    Get default configuration.
+    
+    Built from DEFAULT_CONFIG once per process; the returned instance is
+    shared and read-only.
+    """
     return LimitsConfig.from_dict(DEFAULT_CONFIG)
 
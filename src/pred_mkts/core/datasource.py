@@ -10,7 +10,31 @@ and pagination capabilities.
 from abc import ABC, abstractmethod
 from collections.abc import Iterator
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any, Callable
+from urllib.parse import urlsplit
+
+
+@lru_cache(maxsize=1024)
+def _host_from_url(url: str) -> str:
+    """
+    Return the URL's host[:port], lowercased, without any userinfo.
+    
+    Host names are case-insensitive, so specs differing only in host case
+    share a rate limit bucket. Credentials in the URL (user:secret@) are
+    dropped so they never reach bucket keys or telemetry. Cached since
+    callers hit few distinct URLs.
+    """
+    parts = urlsplit(url)
+    host = parts.hostname or ""
+    if ":" in host:
+        # IPv6 literal; hostname strips the brackets
+        host = f"[{host}]"
+    try:
+        port = parts.port
+    except ValueError:
+        port = None
+    return f"{host}:{port}" if port is not None else host
 
 
 @dataclass
@@ -30,6 +54,16 @@ class RequestSpec:
     headers: dict[str, str] = field(default_factory=dict)
     query_params: dict[str, Any] = field(default_factory=dict)
     body: dict[str, Any] | None = None
+    
+    @property
+    def host(self) -> str:
+        """
+        Lowercased host[:port] of the URL, without userinfo.
+        
+        Parsing is shared across specs built for the same URL, as
+        prepare_request does on every call. Empty string for relative URLs.
+        """
+        return _host_from_url(self.url)
 
 
 @dataclass
@@ -11,23 +11,124 @@ This module implements an adaptive rate limiter that:
 - Emits structured telemetry for monitoring
 """
 import asyncio
+import bisect
+import functools
 import logging
 import random
 import re
 import threading
 from abc import ABC, abstractmethod
-from collections import defaultdict
+from array import array
 from contextlib import asynccontextmanager, contextmanager
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timezone
 from email.utils import parsedate_to_datetime
-from typing import Any, Dict, Optional
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterator,
+    Mapping,
+    Optional,
+    Tuple,
+    TypedDict,
+)
 
+try:
+    from multidict import CIMultiDict, CIMultiDictProxy
+except ImportError:
+    _CI_HEADER_TYPES: Tuple[type, ...] = ()
+else:
+    _CI_HEADER_TYPES = (CIMultiDict, CIMultiDictProxy)
+
+from ._token_bucket_nb import refill_python
 from .config import ExchangeConfig
 from .datasource import RequestSpec
-from .telemetry import TelemetryDecision, create_event, get_recorder
+from .telemetry import TelemetryDecision, TelemetryLevel, create_event, get_recorder
 
 logger = logging.getLogger(__name__)
 
+# Refill kernel: (tokens, last, now, rate, capacity) -> (tokens, last)
+RefillFn = Callable[[float, float, float, float, float], Tuple[float, float]]
+
+
+class RateLimitInfo(TypedDict, total=False):
+    """Rate limit values parsed from X-RateLimit-* headers."""
+    
+    limit: int
+    remaining: int
+    reset: float
+
+
+# Number of recent request timestamps kept for get_recent_rate()
+_RECENT_WINDOW_SIZE = 1024
+
+
+# IMF-fixdate (RFC 9110), the only HTTP-date form servers may generate
+_IMF_FIXDATE_RE = re.compile(
+    r"^[A-Z][a-z]{2}, (\d{2}) ([A-Z][a-z]{2}) (\d{4}) (\d{2}):(\d{2}):(\d{2}) GMT$"
+)
+_MONTHS = {
+    "Jan": 1, "Feb": 2, "Mar": 3, "Apr": 4, "May": 5, "Jun": 6,
+    "Jul": 7, "Aug": 8, "Sep": 9, "Oct": 10, "Nov": 11, "Dec": 12,
+}
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_http_date(value: str) -> Optional[float]:
+    """
+    Parse an HTTP-date into a Unix timestamp.
+    
+    IMF-fixdate is parsed directly; the obsolete RFC 850 and asctime forms
+    fall back to email.utils. Cached on the raw header string: servers
+    tend to repeat the same Retry-After date across a burst of 429s.
+    
+    Args:
+        value: HTTP-date header value
+        
+    Returns:
+        Unix timestamp, or None if the value isn't a valid date
+    """
+    match = _IMF_FIXDATE_RE.match(value)
+    if match:
+        day, month, year, hour, minute, second = match.groups()
+        month_num = _MONTHS.get(month)
+        if month_num is not None:
+            try:
+                return datetime(
+                    int(year), month_num, int(day),
+                    int(hour), int(minute), int(second),
+                    tzinfo=timezone.utc,
+                ).timestamp()
+            except ValueError:
+                return None
+    
+    try:
+        retry_date = parsedate_to_datetime(value)
+    except (ValueError, TypeError):
+        return None
+    # asctime dates carry no zone; HTTP-dates are always GMT
+    if retry_date.tzinfo is None:
+        retry_date = retry_date.replace(tzinfo=timezone.utc)
+    return retry_date.timestamp()
+
+
+class _FoldedHeaders(dict):
+    """Response headers re-keyed by lowercased name (see _fold_headers)."""
+
+
+def _fold_headers(headers: Mapping[str, str]) -> Mapping[str, str]:
+    """
+    Return a view of headers that answers lowercased-name lookups.
+    
+    Case-insensitive multidicts (aiohttp responses) and already-folded
+    headers are returned as-is; other mappings are lowercased once.
+    """
+    if isinstance(headers, (_FoldedHeaders,) + _CI_HEADER_TYPES):
+        return headers
+    return _FoldedHeaders((k.lower(), v) for k, v in headers.items())
+
 
 # [CTX:PBI-0:0-3:RL] TimeProvider protocol for testability
 class TimeProvider(ABC):
@@ -37,6 +138,15 @@ class TimeProvider(ABC):
     def now(self) -> float:
         """Return current time in seconds since epoch."""
         pass
+    
+    def monotonic(self) -> float:
+        """
+        Return seconds from a clock that never goes backwards.
+        
+        Used for measuring elapsed time (token refill). Only differences
+        are meaningful. Defaults to now(), which suits fake clocks.
+        """
+        return self.now()
 
 
 class SystemTimeProvider(TimeProvider):
@@ -45,28 +155,37 @@ class SystemTimeProvider(TimeProvider):
     def now(self) -> float:
         import time
         return time.time()
+    
+    def monotonic(self) -> float:
+        import time
+        return time.monotonic()
 
 
 class FakeTimeProvider(TimeProvider):
-    """Fake time provider for deterministic tests."""
+    """
+    Fake time provider for deterministic tests.
+    
+    The current time lives in a one-element list so now() is a single
+    subscript (atomic under the GIL) and advance() needs no mutex. Readers
+    only rely on monotonicity, not strict serialization of concurrent
+    advances; set() still takes a lock for callers that jump time around.
+    """
     
     def __init__(self, initial_time: float = 1000.0):
-        self._current_time = initial_time
+        self._t = [initial_time]
         self._lock = threading.Lock()
     
     def now(self) -> float:
-        with self._lock:
-            return self._current_time
+        return self._t[0]
     
     def advance(self, seconds: float) -> None:
         """Advance time by given seconds."""
-        with self._lock:
-            self._current_time += seconds
+        self._t[0] = self._t[0] + seconds
     
     def set(self, time: float) -> None:
         """Set absolute time."""
         with self._lock:
-            self._current_time = time
+            self._t[0] = time
 
 
 # [CTX:PBI-0:0-3:RL] Token bucket implementation
@@ -82,7 +201,8 @@ class TokenBucket:
         rate: float,
         capacity: int,
         time_provider: TimeProvider,
-        initial_tokens: Optional[int] = None
+        initial_tokens: Optional[int] = None,
+        refill: Optional[RefillFn] = None
     ):
         """
         Initialize token bucket.
@@ -92,24 +212,28 @@ class TokenBucket:
             capacity: Maximum tokens in bucket (burst capacity)
             time_provider: Time provider for getting current time
             initial_tokens: Initial number of tokens (defaults to capacity)
+            refill: Refill kernel (defaults to the pure-Python one; pass
+                _token_bucket_nb.refill_numba for the JIT-compiled variant)
         """
         self.rate = rate
         self.capacity = capacity
         self.time_provider = time_provider
+        self._refill_fn = refill or refill_python
         self._tokens = initial_tokens if initial_tokens is not None else capacity
         # CRITICAL: Use time_provider, not time.time()
-        self._last_refill = self.time_provider.now()
+        self._last_refill = self.time_provider.monotonic()
         self._lock = threading.Lock()
     
     def _refill(self) -> None:
         """Refill tokens based on elapsed time."""
-        now = self.time_provider.now()
-        elapsed = now - self._last_refill
-        
         # Add tokens based on elapsed time
-        new_tokens = elapsed * self.rate
-        self._tokens = min(self.capacity, self._tokens + new_tokens)
-        self._last_refill = now
+        self._tokens, self._last_refill = self._refill_fn(
+            self._tokens,
+            self._last_refill,
+            self.time_provider.monotonic(),
+            self.rate,
+            self.capacity,
+        )
     
     def consume(self, tokens: int = 1) -> bool:
         """
@@ -134,6 +258,30 @@ class TokenBucket:
             self._refill()
             return self._tokens
     
+    def consume_or_delay(self, tokens: int = 1) -> float:
+        """
+        Consume tokens if available, else report when they will be.
+        
+        Combines consume() and time_until_tokens() under a single lock and
+        refill, so a throttled waiter learns its next-conforming time
+        without a second pass over the bucket.
+        
+        Args:
+            tokens: Number of tokens to consume
+            
+        Returns:
+            0.0 if the tokens were consumed, otherwise seconds until they
+            will be available (nothing is consumed in that case)
+        """
+        with self._lock:
+            self._refill()
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return 0.0
+            
+            tokens_needed = tokens - self._tokens
+            return tokens_needed / self.rate if self.rate > 0 else float('inf')
+    
     def time_until_tokens(self, tokens: int = 1) -> float:
         """
         Calculate time until specified tokens are available.
@@ -186,10 +334,12 @@ class RateLimitGuard:
     Attributes:
         wait_time: Time spent waiting for rate limit
         bucket_key: Key identifying which bucket was used
+        bucket: The bucket itself, so follow-up calls skip the lookup
     """
     
     wait_time: float = 0.0
     bucket_key: str = ""
+    bucket: Optional[TokenBucket] = field(default=None, repr=False, compare=False)
 
 
 # [CTX:PBI-0:0-3:RL] Main rate limiter
@@ -202,13 +352,15 @@ class RateLimiter:
     - Adaptive rate based on X-RateLimit-* headers
     - 429 handling with Retry-After support
     - 5xx retry with exponential backoff
-    - Concurrency control via semaphores
+    - Per-bucket concurrency control via semaphores
     """
     
     def __init__(
         self,
         exchange_config: ExchangeConfig,
-        time_provider: Optional[TimeProvider] = None
+        time_provider: Optional[TimeProvider] = None,
+        rng: Optional[random.Random] = None,
+        max_total_concurrency: Optional[int] = None
     ):
         """
         Initialize rate limiter.
@@ -216,47 +368,114 @@ class RateLimiter:
         Args:
             exchange_config: Configuration for the exchange
             time_provider: Optional time provider (defaults to system time)
+            rng: Optional random source for backoff jitter (defaults to a
+                private unseeded random.Random); pass a seeded one in tests
+            max_total_concurrency: Optional cap on in-flight requests across
+                all buckets; exchange_config.max_concurrency applies per bucket
         """
         self.config = exchange_config
         self.time_provider = time_provider or SystemTimeProvider()
+        self._rng = rng or random.Random()
         
-        # Per-host token buckets
+        # Per-host token buckets; relative URLs use the configured host,
+        # lowercased like URL hosts so both land in the same bucket
         self._buckets: Dict[str, TokenBucket] = {}
-        self._bucket_lock = threading.Lock()
+        self._default_bucket_key = exchange_config.host.lower()
         
-        # Concurrency control
-        self._semaphore = threading.Semaphore(exchange_config.max_concurrency)
-        self._async_semaphore = asyncio.Semaphore(exchange_config.max_concurrency)
+        # Concurrency control: per-bucket semaphores, plus an optional global cap
+        self._semaphores: Dict[str, threading.Semaphore] = {}
+        self._async_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._total_semaphore: Optional[threading.Semaphore] = None
+        self._total_async_semaphore: Optional[asyncio.Semaphore] = None
+        if max_total_concurrency is not None:
+            self._total_semaphore = threading.Semaphore(max_total_concurrency)
+            self._total_async_semaphore = asyncio.Semaphore(max_total_concurrency)
         
         # Statistics
         self._stats = RateLimiterStats()
         self._stats_lock = threading.Lock()
         
+        # Ring buffer of recent request times (oldest overwritten first)
+        self._recent_times = array("d", bytes(8 * _RECENT_WINDOW_SIZE))
+        self._recent_head = 0
+        self._recent_count = 0
+        
+        # Header names, lowercased once for case-insensitive lookups
+        header_config = exchange_config.headers
+        self._limit_header = header_config.get("limit", "X-RateLimit-Limit").lower()
+        self._remaining_header = header_config.get(
+            "remaining", "X-RateLimit-Remaining"
+        ).lower()
+        self._reset_header = header_config.get("reset", "X-RateLimit-Reset").lower()
+        self._retry_after_header = header_config.get(
+            "retry_after", "Retry-After"
+        ).lower()
+        # (configured name, lowercased name) reported in telemetry
+        self._telemetry_headers = tuple(
+            (name, name.lower())
+            for name in (
+                header_config.get(key)
+                for key in ("limit", "remaining", "reset", "retry_after")
+            )
+            if name
+        )
+        
         # Retry configuration
         self._max_retries_5xx = 3
         self._base_backoff = 1.0
         self._max_backoff = 60.0
+        
+        # Un-jittered backoff per attempt, up to the first capped entry
+        table = [self._base_backoff]
+        while table[-1] < self._max_backoff:
+            table.append(min(table[-1] * 2, self._max_backoff))
+        self._backoff_table = tuple(table)
     
     def _get_bucket_key(self, request_spec: RequestSpec) -> str:
         """
         Get bucket key for request.
         
-        Currently uses host-based bucketing. Could be extended to support
+        Currently uses host-based bucketing on the URL's lowercased
+        host[:port] (never userinfo); relative URLs fall back to the
+        configured host, also lowercased. Each distinct host gets its own
+        steady_rate/burst budget, so an exchange served from several hosts
+        is limited per host, not in total. Could be extended to support
         per-endpoint bucketing based on config.buckets patterns.
         """
-        # Simple host-based bucketing for now
-        return self.config.host
+        return request_spec.host or self._default_bucket_key
     
     def _get_or_create_bucket(self, key: str) -> TokenBucket:
         """Get existing bucket or create new one."""
-        with self._bucket_lock:
-            if key not in self._buckets:
-                self._buckets[key] = TokenBucket(
-                    rate=self.config.steady_rate,
-                    capacity=self.config.burst,
-                    time_provider=self.time_provider
-                )
-            return self._buckets[key]
+        # Fast path: buckets are never replaced, so a hit needs no lock
+        bucket = self._buckets.get(key)
+        if bucket is not None:
+            return bucket
+        
+        # setdefault is atomic under the GIL: racing creators each build a
+        # bucket, but all of them get back the one that was stored first
+        return self._buckets.setdefault(key, TokenBucket(
+            rate=self.config.steady_rate,
+            capacity=self.config.burst,
+            time_provider=self.time_provider
+        ))
+    
+    def _get_semaphore(self, key: str) -> threading.Semaphore:
+        """Get the concurrency semaphore for a bucket (synchronous)."""
+        sem = self._semaphores.get(key)
+        if sem is not None:
+            return sem
+        return self._semaphores.setdefault(
+            key, threading.Semaphore(self.config.max_concurrency)
+        )
+    
+    def _get_async_semaphore(self, key: str) -> asyncio.Semaphore:
+        """Get the concurrency semaphore for a bucket (asynchronous)."""
+        sem = self._async_semaphores.get(key)
+        if sem is not None:
+            return sem
+        return self._async_semaphores.setdefault(
+            key, asyncio.Semaphore(self.config.max_concurrency)
+        )
     
     def _parse_retry_after(self, retry_after: str) -> Optional[float]:
         """
@@ -268,90 +487,89 @@ class RateLimiter:
         Returns:
             Seconds to wait, or None if parse failed
         """
-        # Try parsing as integer seconds
+        # Delta-seconds is the common form; skip the exception path for it.
+        # isdigit() alone also accepts Unicode digits that float() rejects
+        if retry_after.isascii() and retry_after.isdigit():
+            return float(retry_after)
+        
+        # Other numeric forms (e.g. fractional seconds)
         try:
             return float(retry_after)
         except ValueError:
             pass
         
         # Try parsing as HTTP-date
-        try:
-            retry_date = parsedate_to_datetime(retry_after)
-            now = self.time_provider.now()
-            # Convert to timestamp and calculate delta
-            import datetime
-            retry_timestamp = retry_date.timestamp()
-            wait_time = max(0, retry_timestamp - now)
-            return wait_time
-        except (ValueError, TypeError):
+        retry_timestamp = _parse_http_date(retry_after)
+        if retry_timestamp is None:
             return None
+        return max(0, retry_timestamp - self.time_provider.now())
     
     def _parse_rate_limit_headers(
         self,
-        headers: Dict[str, str]
-    ) -> Optional[Dict[str, Any]]:
+        headers: Mapping[str, str]
+    ) -> Optional[RateLimitInfo]:
         """
         Parse X-RateLimit-* headers from response.
         
+        Header names match case-insensitively.
+        
         Returns:
             Dict with 'limit', 'remaining', 'reset' if headers present
         """
-        header_config = self.config.headers
-        result = {}
-        
-        # Get header names from config
-        limit_header = header_config.get("limit", "X-RateLimit-Limit")
-        remaining_header = header_config.get("remaining", "X-RateLimit-Remaining")
-        reset_header = header_config.get("reset", "X-RateLimit-Reset")
+        headers = _fold_headers(headers)
+        result: RateLimitInfo = {}
         
         # Parse limit
-        if limit_header in headers:
+        value = headers.get(self._limit_header)
+        if value is not None:
             try:
-                result["limit"] = int(headers[limit_header])
+                result["limit"] = int(value)
             except ValueError:
                 pass
         
         # Parse remaining
-        if remaining_header in headers:
+        value = headers.get(self._remaining_header)
+        if value is not None:
             try:
-                result["remaining"] = int(headers[remaining_header])
+                result["remaining"] = int(value)
             except ValueError:
                 pass
         
         # Parse reset (usually Unix timestamp)
-        if reset_header in headers:
+        value = headers.get(self._reset_header)
+        if value is not None:
             try:
-                result["reset"] = float(headers[reset_header])
+                result["reset"] = float(value)
             except ValueError:
                 pass
         
         return result if result else None
     
-    def _extract_relevant_headers(self, headers: Dict[str, str]) -> Dict[str, str]:
+    def _extract_relevant_headers(self, headers: Mapping[str, str]) -> Dict[str, str]:
         """
         Extract relevant rate limit headers for telemetry.
         
         Args:
-            headers: Full response headers
+            headers: Full response headers (names match case-insensitively)
             
         Returns:
-            Dict of relevant headers
+            Dict of relevant headers, keyed by their configured names
         """
-        relevant = {}
-        header_config = self.config.headers
+        headers = _fold_headers(headers)
+        relevant: Dict[str, str] = {}
         
         # Standard rate limit headers
-        for key in ["limit", "remaining", "reset", "retry_after"]:
-            header_name = header_config.get(key)
-            if header_name and header_name in headers:
-                relevant[header_name] = headers[header_name]
+        for header_name, folded_name in self._telemetry_headers:
+            value = headers.get(folded_name)
+            if value is not None:
+                relevant[header_name] = value
         
         return relevant
     
     def _apply_adaptive_rate(
         self,
         bucket: TokenBucket,
-        rate_info: Dict[str, Any]
+        rate_info: RateLimitInfo
     ) -> None:
         """
         Adjust bucket rate based on server-provided limits.
@@ -377,8 +595,9 @@ class RateLimiter:
             # Only adjust if significantly different
             if abs(new_rate - bucket.rate) / bucket.rate > 0.1:
                 logger.info(
-                    f"[CTX:PBI-0:0-3:RL] Adaptive rate adjustment: "
-                    f"{bucket.rate:.2f} -> {new_rate:.2f} tokens/sec"
+                    "[CTX:PBI-0:0-3:RL] Adaptive rate adjustment: "
+                    "%.2f -> %.2f tokens/sec",
+                    bucket.rate, new_rate,
                 )
                 bucket.rate = new_rate
                 
@@ -396,17 +615,18 @@ class RateLimiter:
         Returns:
             Seconds to wait
         """
-        backoff = min(self._base_backoff * (2 ** attempt), self._max_backoff)
+        table = self._backoff_table
+        backoff = table[attempt] if attempt < len(table) else self._max_backoff
         
         if jitter:
             # Add ±25% jitter
-            jitter_factor = 0.75 + random.random() * 0.5
+            jitter_factor = 0.75 + self._rng.random() * 0.5
             backoff *= jitter_factor
         
         return backoff
     
     @contextmanager
-    def acquire(self, request_spec: RequestSpec):
+    def acquire(self, request_spec: RequestSpec) -> Iterator[RateLimitGuard]:
         """
         Acquire rate limit permission (synchronous).
         
@@ -421,53 +641,151 @@ class RateLimiter:
         bucket_key = self._get_bucket_key(request_spec)
         bucket = self._get_or_create_bucket(bucket_key)
         
-        # Acquire semaphore for concurrency control
-        self._semaphore.acquire()
+        # Wait for tokens before taking a concurrency slot, so throttled
+        # callers sleep side by side instead of queueing behind the semaphore
+        wait_time = 0.0
+        while True:
+            sleep_time = bucket.consume_or_delay(1)
+            if sleep_time == 0.0:
+                break
+            time.sleep(min(sleep_time, 0.1))  # Sleep in small increments
+            wait_time += min(sleep_time, 0.1)
+        
+        # Acquire semaphores for concurrency control
+        semaphore = self._get_semaphore(bucket_key)
+        total_semaphore = self._total_semaphore
+        semaphore.acquire()
+        if total_semaphore is not None:
+            try:
+                total_semaphore.acquire()
+            except BaseException:
+                semaphore.release()
+                raise
         
         try:
-            # Wait for tokens
-            wait_time = 0.0
-            start_time = time.time()
-            
-            while not bucket.consume(1):
-                sleep_time = bucket.time_until_tokens(1)
-                if sleep_time > 0:
-                    time.sleep(min(sleep_time, 0.1))  # Sleep in small increments
-                    wait_time += min(sleep_time, 0.1)
-            
             # Update stats
             with self._stats_lock:
                 self._stats.requests_total += 1
+                self._record_request_times(1)
                 if wait_time > 0:
                     self._stats.requests_throttled += 1
                     self._stats.total_wait_time += wait_time
             
-            guard = RateLimitGuard(wait_time=wait_time, bucket_key=bucket_key)
+            guard = RateLimitGuard(
+                wait_time=wait_time, bucket_key=bucket_key, bucket=bucket
+            )
             
             # [CTX:PBI-0:0-5:TELEM] Emit telemetry event
-            decision = TelemetryDecision.THROTTLE if wait_time > 0 else TelemetryDecision.ALLOW
-            event = create_event(
-                exchange=self.config.host,
-                endpoint=request_spec.url,
-                decision=decision,
-                sleep_s=wait_time,
-                bucket_key=bucket_key,
-                tokens_available=bucket.peek(),
-            )
-            get_recorder().record(event)
+            # Routine allows only reach DEBUG logs; skip building the event
+            # when the recorder would drop it
+            if wait_time > 0:
+                decision, level = TelemetryDecision.THROTTLE, TelemetryLevel.INFO
+            else:
+                decision, level = TelemetryDecision.ALLOW, TelemetryLevel.DEBUG
+            recorder = get_recorder()
+            if recorder.enabled_for(level):
+                recorder.record(create_event(
+                    exchange=self.config.host,
+                    endpoint=request_spec.url,
+                    decision=decision,
+                    sleep_s=wait_time,
+                    bucket_key=bucket_key,
+                    tokens_available=bucket.peek(),
+                ))
             
             logger.debug(
-                f"[CTX:PBI-0:0-3:RL] Acquired rate limit for {bucket_key}, "
-                f"waited {wait_time:.3f}s"
+                "[CTX:PBI-0:0-3:RL] Acquired rate limit for %s, waited %.3fs",
+                bucket_key, wait_time,
             )
             
             yield guard
             
         finally:
-            self._semaphore.release()
+            if total_semaphore is not None:
+                total_semaphore.release()
+            semaphore.release()
+    
+    def consume_many(self, request_spec: RequestSpec, count: int) -> RateLimitGuard:
+        """
+        Take tokens for a batch of requests in one bucket operation (synchronous).
+        
+        Meant for bulk fetches that would otherwise call acquire() in a loop:
+        the bucket lookup, token check and stats update happen once for the
+        whole batch. No concurrency slot is held; callers fan out themselves.
+        
+        Args:
+            request_spec: Request specification shared by the batch
+            count: Number of requests (tokens) to account for
+            
+        Returns:
+            RateLimitGuard with wait time information
+            
+        Raises:
+            ValueError: If count is less than 1 or exceeds the bucket capacity
+        """
+        import time
+        
+        if count < 1:
+            raise ValueError(f"Cannot consume {count} tokens, count must be at least 1")
+        
+        bucket_key = self._get_bucket_key(request_spec)
+        bucket = self._get_or_create_bucket(bucket_key)
+        
+        if count > bucket.capacity:
+            raise ValueError(
+                f"Cannot consume {count} tokens at once, "
+                f"bucket capacity is {bucket.capacity}"
+            )
+        
+        # Wait for tokens
+        wait_time = 0.0
+        while True:
+            sleep_time = bucket.consume_or_delay(count)
+            if sleep_time == 0.0:
+                break
+            time.sleep(min(sleep_time, 0.1))  # Sleep in small increments
+            wait_time += min(sleep_time, 0.1)
+        
+        # Update stats once for the whole batch
+        with self._stats_lock:
+            self._stats.requests_total += count
+            self._record_request_times(count)
+            if wait_time > 0:
+                self._stats.requests_throttled += count
+                self._stats.total_wait_time += wait_time
+        
+        # [CTX:PBI-0:0-5:TELEM] Emit telemetry event
+        # Routine allows only reach DEBUG logs; skip building the event
+        # when the recorder would drop it
+        if wait_time > 0:
+            decision, level = TelemetryDecision.THROTTLE, TelemetryLevel.INFO
+        else:
+            decision, level = TelemetryDecision.ALLOW, TelemetryLevel.DEBUG
+        recorder = get_recorder()
+        if recorder.enabled_for(level):
+            recorder.record(create_event(
+                exchange=self.config.host,
+                endpoint=request_spec.url,
+                decision=decision,
+                sleep_s=wait_time,
+                bucket_key=bucket_key,
+                tokens_available=bucket.peek(),
+            ))
+        
+        logger.debug(
+            "[CTX:PBI-0:0-3:RL] Consumed %d tokens for %s, waited %.3fs",
+            count, bucket_key, wait_time,
+        )
+        
+        return RateLimitGuard(
+            wait_time=wait_time, bucket_key=bucket_key, bucket=bucket
+        )
     
     @asynccontextmanager
-    async def acquire_async(self, request_spec: RequestSpec):
+    async def acquire_async(
+        self,
+        request_spec: RequestSpec
+    ) -> AsyncIterator[RateLimitGuard]:
         """
         Acquire rate limit permission (asynchronous).
         
@@ -480,72 +798,104 @@ class RateLimiter:
         bucket_key = self._get_bucket_key(request_spec)
         bucket = self._get_or_create_bucket(bucket_key)
         
-        # Acquire semaphore for concurrency control
-        await self._async_semaphore.acquire()
+        # Wait for tokens before taking a concurrency slot, so throttled
+        # tasks sleep side by side instead of queueing behind the semaphore
+        wait_time = 0.0
+        while True:
+            sleep_time = bucket.consume_or_delay(1)
+            if sleep_time == 0.0:
+                break
+            await asyncio.sleep(min(sleep_time, 0.1))
+            wait_time += min(sleep_time, 0.1)
+        
+        # Acquire semaphores for concurrency control
+        semaphore = self._get_async_semaphore(bucket_key)
+        total_semaphore = self._total_async_semaphore
+        await semaphore.acquire()
+        if total_semaphore is not None:
+            try:
+                await total_semaphore.acquire()
+            except BaseException:
+                semaphore.release()
+                raise
         
         try:
-            # Wait for tokens
-            wait_time = 0.0
-            while not bucket.consume(1):
-                sleep_time = bucket.time_until_tokens(1)
-                if sleep_time > 0:
-                    await asyncio.sleep(min(sleep_time, 0.1))
-                    wait_time += min(sleep_time, 0.1)
-            
             # Update stats
             with self._stats_lock:
                 self._stats.requests_total += 1
+                self._record_request_times(1)
                 if wait_time > 0:
                     self._stats.requests_throttled += 1
                     self._stats.total_wait_time += wait_time
             
-            guard = RateLimitGuard(wait_time=wait_time, bucket_key=bucket_key)
+            guard = RateLimitGuard(
+                wait_time=wait_time, bucket_key=bucket_key, bucket=bucket
+            )
             
             # [CTX:PBI-0:0-5:TELEM] Emit telemetry event
-            decision = TelemetryDecision.THROTTLE if wait_time > 0 else TelemetryDecision.ALLOW
-            event = create_event(
-                exchange=self.config.host,
-                endpoint=request_spec.url,
-                decision=decision,
-                sleep_s=wait_time,
-                bucket_key=bucket_key,
-                tokens_available=bucket.peek(),
-            )
-            get_recorder().record(event)
+            # Routine allows only reach DEBUG logs; skip building the event
+            # when the recorder would drop it
+            if wait_time > 0:
+                decision, level = TelemetryDecision.THROTTLE, TelemetryLevel.INFO
+            else:
+                decision, level = TelemetryDecision.ALLOW, TelemetryLevel.DEBUG
+            recorder = get_recorder()
+            if recorder.enabled_for(level):
+                recorder.record(create_event(
+                    exchange=self.config.host,
+                    endpoint=request_spec.url,
+                    decision=decision,
+                    sleep_s=wait_time,
+                    bucket_key=bucket_key,
+                    tokens_available=bucket.peek(),
+                ))
             
             logger.debug(
-                f"[CTX:PBI-0:0-3:RL] Acquired rate limit for {bucket_key}, "
-                f"waited {wait_time:.3f}s"
+                "[CTX:PBI-0:0-3:RL] Acquired rate limit for %s, waited %.3fs",
+                bucket_key, wait_time,
             )
             
             yield guard
             
         finally:
-            self._async_semaphore.release()
+            if total_semaphore is not None:
+                total_semaphore.release()
+            semaphore.release()
     
     def handle_response_headers(
         self,
         request_spec: RequestSpec,
-        headers: Dict[str, str],
+        headers: Mapping[str, str],
         status_code: int,
         elapsed_ms: float = 0.0,
-        attempt: int = 0
+        attempt: int = 0,
+        guard: Optional[RateLimitGuard] = None
     ) -> Optional[float]:
         """
         Process response headers and return wait time if needed.
         
         Args:
             request_spec: The request that was made
-            headers: Response headers
+            headers: Response headers; names match case-insensitively, and
+                an aiohttp multidict is used as-is without copying
             status_code: HTTP status code
             elapsed_ms: Request duration in milliseconds
             attempt: Retry attempt number
+            guard: Guard from the acquire() that covered this request; its
+                bucket is reused instead of being looked up again
             
         Returns:
             Seconds to wait before retry, or None if no wait needed
         """
-        bucket_key = self._get_bucket_key(request_spec)
-        bucket = self._get_or_create_bucket(bucket_key)
+        if guard is not None and guard.bucket is not None:
+            bucket_key = guard.bucket_key
+            bucket = guard.bucket
+        else:
+            bucket_key = self._get_bucket_key(request_spec)
+            bucket = self._get_or_create_bucket(bucket_key)
+        
+        # Fold header names once; the helpers below reuse the folded view
+        headers = _fold_headers(headers)
         
         # Extract relevant rate limit headers for telemetry
         relevant_headers = self._extract_relevant_headers(headers)
@@ -577,8 +927,9 @@ class RateLimiter:
                 wait_time = max(0, reset - now)
                 
                 logger.warning(
-                    f"[CTX:PBI-0:0-3:RL] Rate limit exhausted, "
-                    f"sleeping until reset: {wait_time:.2f}s"
+                    "[CTX:PBI-0:0-3:RL] Rate limit exhausted, "
+                    "sleeping until reset: %.2fs",
+                    wait_time,
                 )
                 
                 with self._stats_lock:
@@ -607,13 +958,13 @@ class RateLimiter:
                 self._stats.requests_429 += 1
             
             # Check for Retry-After header
-            retry_after_header = self.config.headers.get("retry_after", "Retry-After")
-            if retry_after_header in headers:
-                wait_time = self._parse_retry_after(headers[retry_after_header])
+            retry_after = headers.get(self._retry_after_header)
+            if retry_after is not None:
+                wait_time = self._parse_retry_after(retry_after)
                 if wait_time is not None:
                     logger.warning(
-                        f"[CTX:PBI-0:0-3:RL] 429 response, "
-                        f"Retry-After: {wait_time:.2f}s"
+                        "[CTX:PBI-0:0-3:RL] 429 response, Retry-After: %.2fs",
+                        wait_time,
                     )
                     
                     # [CTX:PBI-0:0-5:TELEM] Emit backoff event
@@ -636,8 +987,8 @@ class RateLimiter:
             # Fallback to exponential backoff
             wait_time = self._calculate_backoff(0)
             logger.warning(
-                f"[CTX:PBI-0:0-3:RL] 429 response, "
-                f"using backoff: {wait_time:.2f}s"
+                "[CTX:PBI-0:0-3:RL] 429 response, using backoff: %.2fs",
+                wait_time,
             )
             
             # [CTX:PBI-0:0-5:TELEM] Emit backoff event
@@ -665,8 +1016,8 @@ class RateLimiter:
             # Use exponential backoff for 5xx
             wait_time = self._calculate_backoff(0)
             logger.warning(
-                f"[CTX:PBI-0:0-3:RL] {status_code} response, "
-                f"using backoff: {wait_time:.2f}s"
+                "[CTX:PBI-0:0-3:RL] %d response, using backoff: %.2fs",
+                status_code, wait_time,
             )
             
             # [CTX:PBI-0:0-5:TELEM] Emit backoff event
@@ -714,16 +1065,17 @@ class RateLimiter:
             # Only retry idempotent methods
             if method.upper() not in ("GET", "HEAD", "PUT", "DELETE", "OPTIONS"):
                 logger.warning(
-                    f"[CTX:PBI-0:0-3:RL] Not retrying {status_code} for "
-                    f"non-idempotent method {method}"
+                    "[CTX:PBI-0:0-3:RL] Not retrying %d for "
+                    "non-idempotent method %s",
+                    status_code, method,
                 )
                 return False
             
             # Check retry limit
             if attempt >= self._max_retries_5xx:
                 logger.error(
-                    f"[CTX:PBI-0:0-3:RL] Max retries ({self._max_retries_5xx}) "
-                    f"exceeded for {status_code}"
+                    "[CTX:PBI-0:0-3:RL] Max retries (%d) exceeded for %d",
+                    self._max_retries_5xx, status_code,
                 )
                 return False
             
@@ -732,19 +1084,71 @@ class RateLimiter:
         return False
     
     def get_stats(self) -> RateLimiterStats:
-        """Get current statistics."""
+        """Get a snapshot of current statistics (covers all buckets)."""
         with self._stats_lock:
-            return RateLimiterStats(
-                requests_total=self._stats.requests_total,
-                requests_throttled=self._stats.requests_throttled,
-                requests_429=self._stats.requests_429,
-                requests_5xx=self._stats.requests_5xx,
-                total_wait_time=self._stats.total_wait_time,
-                adaptive_adjustments=self._stats.adaptive_adjustments,
-            )
+            return replace(self._stats)
+    
+    def _record_request_times(self, count: int) -> None:
+        """
+        Append count copies of the current time to the recent-request ring.
+        
+        Caller must hold _stats_lock. Times are monotonic, so wall-clock
+        steps cannot unsort the ring.
+        """
+        now = self.time_provider.monotonic()
+        times = self._recent_times
+        size = len(times)
+        head = self._recent_head
+        for _ in range(min(count, size)):
+            times[head] = now
+            head = (head + 1) % size
+        self._recent_head = head
+        self._recent_count = min(self._recent_count + count, size)
+    
+    def get_recent_rate(
+        self,
+        window_seconds: float,
+        current_time: Optional[float] = None
+    ) -> float:
+        """
+        Get the request rate over a trailing time window.
+        
+        Only the last _RECENT_WINDOW_SIZE requests are remembered, so very
+        long windows at high rates are undercounted.
+        
+        Args:
+            window_seconds: Window length in seconds
+            current_time: End of the window on the time provider's
+                monotonic clock (defaults to its current monotonic time)
+            
+        Returns:
+            Requests per second within the window
+        """
+        if current_time is None:
+            current_time = self.time_provider.monotonic()
+        cutoff = current_time - window_seconds
+        
+        with self._stats_lock:
+            times = self._recent_times
+            head = self._recent_head
+            count = self._recent_count
+            
+            # Times are recorded in order, so the ring is two sorted runs:
+            # [head, size) holds the older entries once it has wrapped
+            if count < len(times):
+                in_window = count - bisect.bisect_left(times, cutoff, 0, count)
+            else:
+                in_window = (
+                    len(times) - bisect.bisect_left(times, cutoff, head)
+                    + head - bisect.bisect_left(times, cutoff, 0, head)
+                )
+        
+        return in_window / window_seconds
     
     def reset_stats(self) -> None:
         """Reset statistics."""
         with self._stats_lock:
             self._stats = RateLimiterStats()
+            self._recent_head = 0
+            self._recent_count = 0
 
@@ -8,17 +8,112 @@ This module provides structured logging capabilities for understanding:
 - Retry behavior and backoff decisions
 - Response header patterns from exchanges
 """
+import atexit
 import json
 import logging
+import math
+import queue
+import sys
 import threading
 import time
-from dataclasses import asdict, dataclass, field
+import weakref
+from array import array
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field, fields, replace
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+try:
+    import orjson
+except ImportError:  # optional "fast" extra
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # optional "msgpack" extra
+    msgpack = None
 
 logger = logging.getLogger(__name__)
 
 
+def _dumps_json(data: Dict[str, Any]) -> bytes:
+    """
+    Encode an event dict as compact UTF-8 JSON.
+    
+    The stdlib fallback is made to match orjson byte for byte: no spaces
+    after separators, raw UTF-8, and NaN/Infinity written as null.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, default=str)
+    try:
+        text = json.dumps(
+            data, default=str, separators=(",", ":"), ensure_ascii=False,
+            allow_nan=False,
+        )
+    except ValueError:
+        # Non-finite floats only occur in the top-level numeric fields
+        data = {
+            key: None if type(value) is float and not math.isfinite(value) else value
+            for key, value in data.items()
+        }
+        text = json.dumps(
+            data, default=str, separators=(",", ":"), ensure_ascii=False
+        )
+    return text.encode()
+
+# Response headers as (name, value) pairs, names interned
+HeaderPairs = Tuple[Tuple[str, str], ...]
+
+
+class HeaderView(Mapping):
+    """
+    Read-only mapping over a tuple of (name, value) header pairs.
+    
+    Events hold only a few headers, so lookups scan the pairs instead of
+    keeping a dict per event.
+    """
+    
+    __slots__ = ("_pairs",)
+    
+    def __init__(self, pairs: HeaderPairs = ()) -> None:
+        self._pairs = pairs
+    
+    def __getitem__(self, name: str) -> str:
+        for key, value in self._pairs:
+            if key == name:
+                return value
+        raise KeyError(name)
+    
+    def __iter__(self) -> Iterator[str]:
+        return (key for key, _ in self._pairs)
+    
+    def __len__(self) -> int:
+        return len(self._pairs)
+    
+    def __hash__(self) -> int:
+        return hash(frozenset(self._pairs))
+    
+    def __repr__(self) -> str:
+        return f"HeaderView({dict(self._pairs)!r})"
+
+
+_NO_HEADERS = HeaderView()
+
+
 class TelemetryLevel(Enum):
     """Telemetry verbosity levels."""
     INFO = "info"
@@ -35,7 +130,7 @@ class TelemetryDecision(Enum):
 
 
 # [CTX:PBI-0:0-5:TELEM] Telemetry event structure
-@dataclass
+@dataclass(slots=True)
 class TelemetryEvent:
     """
     A single telemetry event capturing rate limiter or DataSource activity.
@@ -48,7 +143,9 @@ class TelemetryEvent:
         elapsed_ms: Request duration in milliseconds
         decision: Rate limiter decision (allow, throttle, backoff, etc.)
         sleep_s: Time slept due to rate limiting
-        headers_seen: Relevant rate limit headers from response
+        headers_seen: Relevant rate limit headers from response, as a
+            read-only mapping with interned names; a mapping or (name,
+            value) pairs passed in are converted
         bucket_key: Rate limit bucket identifier
         attempt: Retry attempt number (0 for first attempt)
         tokens_available: Number of tokens available in bucket
@@ -60,30 +157,120 @@ class TelemetryEvent:
     elapsed_ms: float
     decision: str
     sleep_s: float = 0.0
-    headers_seen: Dict[str, str] = field(default_factory=dict)
+    headers_seen: Mapping[str, str] = _NO_HEADERS
     bucket_key: str = ""
     attempt: int = 0
     tokens_available: float = 0.0
     
+    def __post_init__(self) -> None:
+        if type(self.headers_seen) is not HeaderView:
+            self.headers_seen = _header_view(self.headers_seen)
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert event to dictionary for logging."""
-        return {k: v for k, v in asdict(self).items() if v is not None or k == "status"}
+        # Read the slots directly; asdict() would deep-copy every field
+        result = {}
+        for name in _EVENT_FIELDS:
+            value = getattr(self, name)
+            if value is not None or name == "status":
+                result[name] = dict(value) if name == "headers_seen" else value
+        return result
     
     def to_json(self) -> str:
         """Convert event to JSON string."""
-        return json.dumps(self.to_dict(), default=str)
+        return self.to_json_bytes().decode()
+    
+    def to_json_bytes(self) -> bytes:
+        """Convert event to UTF-8 encoded JSON, for writing to files or sockets."""
+        return _dumps_json(self.to_dict())
+    
+    def to_msgpack(self) -> bytes:
+        """
+        Convert event to a compact MessagePack blob for shipping to a collector.
+        
+        Raises:
+            ImportError: If msgpack is not installed
+        """
+        if msgpack is None:
+            raise ImportError(
+                "to_msgpack() requires msgpack (pip install pred-mkts[msgpack])"
+            )
+        return msgpack.packb(self.to_dict(), use_bin_type=True)
+    
+    def serialized(self) -> Tuple[bytes, Dict[str, Any]]:
+        """
+        Encode the event as JSON and also return the dict it was built from.
+        
+        For consumers that need both forms, e.g. to ship the bytes and
+        inspect fields, without parsing the JSON back.
+        
+        Returns:
+            Tuple of (UTF-8 JSON bytes, event dict)
+        """
+        data = self.to_dict()
+        return _dumps_json(data), data
     
     def to_keyvalue(self) -> str:
         """Convert event to key=value format."""
-        pairs = []
-        for key, value in self.to_dict().items():
-            if isinstance(value, dict):
-                # Flatten nested dicts
-                for subkey, subval in value.items():
-                    pairs.append(f"{key}.{subkey}={subval}")
-            else:
-                pairs.append(f"{key}={value}")
-        return " ".join(pairs)
+        return _emit_keyvalue(self)
+
+
+def _header_view(
+    headers: Optional[Union[Mapping[str, str], HeaderPairs]]
+) -> HeaderView:
+    """Freeze headers into a HeaderView with interned names."""
+    if not headers:
+        return _NO_HEADERS
+    if type(headers) is HeaderView:
+        return headers
+    items = headers.items() if isinstance(headers, Mapping) else headers
+    return HeaderView(tuple([(sys.intern(name), value) for name, value in items]))
+
+
+# Field names in declaration order, resolved once for the serializers
+_EVENT_FIELDS = tuple(f.name for f in fields(TelemetryEvent))
+
+
+def _compile_keyvalue_emitter(field_names: Tuple[str, ...]) -> Callable[[Any], str]:
+    """
+    Generate a key=value formatter unrolled over a fixed set of fields.
+    
+    The field list is known when the class is defined, so the per-field
+    loop, name lookups and type checks of a generic formatter are resolved
+    once here. Fields other than status are skipped when None, and
+    headers_seen is flattened to headers_seen.<name>=<value> pairs.
+    """
+    lines = ["def _emit_keyvalue(event):", "    parts = []"]
+    for name in field_names:
+        lines.append(f"    value = event.{name}")
+        if name == "headers_seen":
+            lines.append(
+                "    if value: parts.extend("
+                "[f'headers_seen.{k}={v}' for k, v in value._pairs])"
+            )
+        elif name == "status":
+            lines.append(f"    parts.append(f'{name}={{value}}')")
+        else:
+            lines.append(f"    if value is not None: parts.append(f'{name}={{value}}')")
+    lines.append("    return ' '.join(parts)")
+    
+    namespace: Dict[str, Any] = {}
+    exec("\n".join(lines), namespace)
+    return namespace["_emit_keyvalue"]
+
+
+_emit_keyvalue = _compile_keyvalue_emitter(_EVENT_FIELDS)
+
+# Free list of recycled events for create_event(); deque append/pop are
+# atomic, so threads can share it without a lock
+_EVENT_POOL_SIZE = 1024
+_event_pool: deque = deque(maxlen=_EVENT_POOL_SIZE)
+
+
+def _release_event(event: TelemetryEvent) -> None:
+    """Return a recorded event to the pool for reuse by create_event()."""
+    event.headers_seen = _NO_HEADERS
+    _event_pool.append(event)
 
 
 # [CTX:PBI-0:0-5:TELEM] In-memory statistics tracker
@@ -119,6 +306,73 @@ class TelemetryStats:
         }
 
 
+# Decision values and HTTP status codes index fixed-size counter arrays;
+# anything outside them falls back to a dict
+_DECISION_INDEX = {decision.value: i for i, decision in enumerate(TelemetryDecision)}
+_DECISION_VALUES = tuple(decision.value for decision in TelemetryDecision)
+_STATUS_SLOTS = 600
+
+
+class _ThreadStats:
+    """Per-thread counters behind TelemetryRecorder statistics."""
+    
+    __slots__ = (
+        "total_requests",
+        "total_sleeps",
+        "total_sleep_time",
+        "total_elapsed_time",
+        "decision_counts",
+        "status_counts",
+        "other_decisions",
+        "other_statuses",
+        "version",
+    )
+    
+    def __init__(self) -> None:
+        self.total_requests = 0
+        self.total_sleeps = 0
+        self.total_sleep_time = 0.0
+        self.total_elapsed_time = 0.0
+        self.decision_counts = array("q", bytes(8 * len(_DECISION_VALUES)))
+        self.status_counts = array("q", bytes(8 * _STATUS_SLOTS))
+        self.other_decisions: Dict[str, int] = {}
+        self.other_statuses: Dict[int, int] = {}
+        # Bumped by the owning thread after each update, so a changed sum
+        # across threads tells get_stats() its cached merge is stale
+        self.version = 0
+    
+    def count_outcome(self, decision: str, status: Optional[int]) -> None:
+        """Count one event's decision and status code."""
+        idx = _DECISION_INDEX.get(decision)
+        if idx is not None:
+            self.decision_counts[idx] += 1
+        else:
+            self.other_decisions[decision] = self.other_decisions.get(decision, 0) + 1
+        
+        if status:
+            if 0 < status < _STATUS_SLOTS:
+                self.status_counts[status] += 1
+            else:
+                self.other_statuses[status] = self.other_statuses.get(status, 0) + 1
+
+
+# Background writer batching: flush after this many events or seconds
+_WRITE_BATCH_SIZE = 1024
+_WRITE_BATCH_WINDOW_S = 0.1
+
+# Recorders with a live writer thread, closed at interpreter exit so events
+# still queued on the daemon writer are not lost
+_EXIT_CLOSE_TIMEOUT_S = 1.0
+_open_recorders: "weakref.WeakSet[TelemetryRecorder]" = weakref.WeakSet()
+
+
+@atexit.register
+def _close_open_recorders() -> None:
+    """Write out pending events of every recorder still exporting."""
+    for recorder in list(_open_recorders):
+        recorder.close(_EXIT_CLOSE_TIMEOUT_S)
+
+
 # [CTX:PBI-0:0-5:TELEM] Main telemetry recorder
 class TelemetryRecorder:
     """
@@ -128,6 +382,7 @@ class TelemetryRecorder:
     - Structured logging in JSON or key=value format
     - Configurable verbosity (info/debug)
     - Optional in-memory statistics collection
+    - Optional batched export to a binary stream on a background thread
     - Thread-safe operation
     """
     
@@ -135,7 +390,11 @@ class TelemetryRecorder:
         self,
         level: TelemetryLevel = TelemetryLevel.INFO,
         format_json: bool = True,
-        collect_stats: bool = False
+        collect_stats: bool = False,
+        keep_events: bool = True,
+        history_max: int = 10_000,
+        wire_format: str = "json",
+        sink: Optional[BinaryIO] = None
     ):
         """
         Initialize telemetry recorder.
@@ -144,18 +403,71 @@ class TelemetryRecorder:
             level: Logging verbosity level
             format_json: If True, log as JSON; otherwise use key=value
             collect_stats: If True, collect in-memory statistics
+            keep_events: If True, keep recorded events for get_events();
+                otherwise events are recycled once recorded, and callers
+                must not use an event after passing it to record()
+            history_max: Number of most recent events kept for get_events()
+            wire_format: Encoding used by encode() when shipping events,
+                "json" or "msgpack"
+            sink: Optional binary stream that recorded events are written
+                to, encoded per wire_format (JSON one per line). Writes are
+                batched on a background thread; see flush() and close()
+            
+        Raises:
+            ValueError: If wire_format is unknown
+            ImportError: If wire_format is "msgpack" and msgpack is missing
         """
+        if wire_format not in ("json", "msgpack"):
+            raise ValueError(f"Unknown telemetry wire format: {wire_format!r}")
+        if wire_format == "msgpack" and msgpack is None:
+            raise ImportError(
+                "wire_format='msgpack' requires msgpack "
+                "(pip install pred-mkts[msgpack])"
+            )
+        
         self.level = level
         self.format_json = format_json
         self.collect_stats = collect_stats
+        self.keep_events = keep_events
+        self.wire_format = wire_format
         
-        # Statistics tracking
-        self._stats = TelemetryStats()
+        # Statistics tracking: each thread updates its own counters without
+        # locking; get_stats() merges them. The lock only guards the
+        # registry of per-thread counters and the reset generation
+        self._local = threading.local()
+        self._thread_stats: List[_ThreadStats] = []
+        self._stats_generation = 0
         self._stats_lock = threading.Lock()
         
-        # Event history (for testing)
-        self._events: List[TelemetryEvent] = []
+        # Merged stats are cached until the next record() or reset_stats(),
+        # keyed by (generation, sum of per-thread versions)
+        self._stats_cache: Optional[Tuple[Tuple[int, int], TelemetryStats]] = None
+        
+        # Event history (for testing), oldest dropped once full
+        self._events: deque = deque(maxlen=history_max)
         self._events_lock = threading.Lock()
+        
+        # Export: record() only enqueues; the writer thread encodes and
+        # writes in batches. Queue items are events, a threading.Event to
+        # set once everything before it is flushed, or None to stop
+        self._sink = sink
+        self._sink_queue: Optional[queue.SimpleQueue] = None
+        self._writer: Optional[threading.Thread] = None
+        if sink is not None:
+            self._sink_queue = queue.SimpleQueue()
+            self._writer = threading.Thread(
+                target=self._write_loop, name="telemetry-writer", daemon=True
+            )
+            self._writer.start()
+            _open_recorders.add(self)
+    
+    def __enter__(self) -> "TelemetryRecorder":
+        """Use the recorder as a context manager that closes it on exit."""
+        return self
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        """Write out pending events and stop the background writer."""
+        self.close()
     
     def record(self, event: TelemetryEvent) -> None:
         """
@@ -164,6 +476,203 @@ class TelemetryRecorder:
         Args:
             event: Event to record
         """
+        self._log_event(event)
+        
+        # Update statistics
+        if self.collect_stats:
+            stats = self._thread_local_stats()
+            stats.total_requests += 1
+            stats.total_elapsed_time += event.elapsed_ms
+            
+            if event.sleep_s > 0:
+                stats.total_sleeps += 1
+                stats.total_sleep_time += event.sleep_s
+            
+            stats.count_outcome(event.decision, event.status)
+            
+            # Bump after updating, so a concurrent get_stats() never caches
+            # a merge that missed this event under the new version
+            stats.version += 1
+        
+        # Store event for retrieval, or recycle it (the writer recycles
+        # exported events once they are encoded). Read the queue once: a
+        # close() on another thread may clear it
+        sink_queue = self._sink_queue
+        if self.keep_events:
+            with self._events_lock:
+                self._events.append(event)
+        elif sink_queue is None:
+            _release_event(event)
+        
+        if sink_queue is not None:
+            sink_queue.put(event)
+    
+    def encode(self, event: TelemetryEvent) -> bytes:
+        """
+        Encode an event in this recorder's wire format.
+        
+        Args:
+            event: Event to encode
+            
+        Returns:
+            JSON or MessagePack bytes, per wire_format
+        """
+        if self.wire_format == "msgpack":
+            return event.to_msgpack()
+        return event.to_json_bytes()
+    
+    def record_many(self, events: Sequence[TelemetryEvent]) -> None:
+        """
+        Record a batch of telemetry events.
+        
+        Equivalent to calling record() for each event, but statistics and
+        history are updated once for the whole batch.
+        
+        Args:
+            events: Events to record, in order
+        """
+        for event in events:
+            self._log_event(event)
+        
+        if self.collect_stats and events:
+            stats = self._thread_local_stats()
+            elapsed = 0.0
+            sleeps = 0
+            sleep_time = 0.0
+            count_outcome = stats.count_outcome
+            for event in events:
+                elapsed += event.elapsed_ms
+                if event.sleep_s > 0:
+                    sleeps += 1
+                    sleep_time += event.sleep_s
+                count_outcome(event.decision, event.status)
+            
+            stats.total_requests += len(events)
+            stats.total_elapsed_time += elapsed
+            stats.total_sleeps += sleeps
+            stats.total_sleep_time += sleep_time
+            stats.version += 1
+        
+        sink_queue = self._sink_queue
+        if self.keep_events:
+            with self._events_lock:
+                self._events.extend(events)
+        elif sink_queue is None:
+            for event in events:
+                _release_event(event)
+        
+        if sink_queue is not None:
+            put = sink_queue.put
+            for event in events:
+                put(event)
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every event recorded so far has been written to the sink.
+        
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+            
+        Returns:
+            True if flushed (or there is no sink), False on timeout
+        """
+        sink_queue = self._sink_queue
+        if sink_queue is None or not self._writer.is_alive():
+            return True
+        done = threading.Event()
+        sink_queue.put(done)
+        return done.wait(timeout)
+    
+    def close(self, timeout: Optional[float] = None) -> None:
+        """
+        Write out pending events and stop the background writer.
+        
+        The sink itself is left open. Events recorded after close() are
+        no longer exported. If the writer is still busy when timeout
+        expires, the recorder stays open and close() can be called again.
+        
+        Args:
+            timeout: Maximum seconds to wait for the writer to finish
+        """
+        sink_queue = self._sink_queue
+        if sink_queue is None:
+            return
+        sink_queue.put(None)
+        self._writer.join(timeout)
+        if not self._writer.is_alive():
+            self._sink_queue = None
+            _open_recorders.discard(self)
+    
+    def _write_loop(self) -> None:
+        """Background writer: batch queued events, encode and write them."""
+        get = self._sink_queue.get
+        separator = b"\n" if self.wire_format == "json" else b""
+        running = True
+        while running:
+            batch: List[TelemetryEvent] = []
+            waiter: Optional[threading.Event] = None
+            
+            item = get()
+            deadline = time.monotonic() + _WRITE_BATCH_WINDOW_S
+            while True:
+                if item is None:
+                    running = False
+                    break
+                if isinstance(item, threading.Event):
+                    waiter = item
+                    break
+                batch.append(item)
+                if len(batch) >= _WRITE_BATCH_SIZE:
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = get(timeout=remaining)
+                except queue.Empty:
+                    break
+            
+            if batch:
+                try:
+                    encode = self.encode
+                    self._sink.write(
+                        b"".join([encode(event) + separator for event in batch])
+                    )
+                    self._sink.flush()
+                except Exception:
+                    logger.exception(
+                        "[CTX:PBI-0:0-5:TELEM] Failed to write %d telemetry events",
+                        len(batch),
+                    )
+                if not self.keep_events:
+                    for event in batch:
+                        _release_event(event)
+            
+            if waiter is not None:
+                waiter.set()
+    
+    def enabled_for(self, level: TelemetryLevel) -> bool:
+        """
+        Check whether recording an event at a level would have any effect.
+        
+        Lets callers skip building events nobody will see, like
+        logging.Logger.isEnabledFor. Events are always observable while
+        stats or history are collected or a sink is attached; otherwise it
+        depends on whether the log record they would produce passes the
+        logger's level.
+        
+        Args:
+            level: INFO for throttle/backoff/adaptive/error events, DEBUG
+                for routine ones
+        """
+        if self.collect_stats or self.keep_events or self._sink_queue is not None:
+            return True
+        if level == TelemetryLevel.DEBUG or self.level == TelemetryLevel.DEBUG:
+            return logger.isEnabledFor(logging.DEBUG)
+        return logger.isEnabledFor(logging.INFO)
+    
+    def _log_event(self, event: TelemetryEvent) -> None:
+        """Format an event and log it at the level its outcome calls for."""
         # Format and log event
         if self.format_json:
             log_message = f"[CTX:PBI-0:0-5:TELEM] {event.to_json()}"
@@ -184,54 +693,85 @@ class TelemetryRecorder:
                 logger.info(log_message)
             else:
                 logger.debug(log_message)
-        
-        # Update statistics
-        if self.collect_stats:
+    
+    def _thread_local_stats(self) -> _ThreadStats:
+        """Get the calling thread's counters, registering them on first use."""
+        local = self._local
+        stats = getattr(local, "stats", None)
+        if stats is None or local.generation != self._stats_generation:
+            stats = _ThreadStats()
             with self._stats_lock:
-                self._stats.total_requests += 1
-                self._stats.total_elapsed_time += event.elapsed_ms
-                
-                if event.sleep_s > 0:
-                    self._stats.total_sleeps += 1
-                    self._stats.total_sleep_time += event.sleep_s
-                
-                # Track decision types
-                decision_key = event.decision
-                self._stats.decisions_by_type[decision_key] = (
-                    self._stats.decisions_by_type.get(decision_key, 0) + 1
-                )
-                
-                # Track status codes
-                if event.status:
-                    self._stats.status_codes[event.status] = (
-                        self._stats.status_codes.get(event.status, 0) + 1
-                    )
-        
-        # Store event for retrieval
-        with self._events_lock:
-            self._events.append(event)
+                local.generation = self._stats_generation
+                self._thread_stats.append(stats)
+            local.stats = stats
+        return stats
     
     def get_stats(self) -> TelemetryStats:
-        """Get current statistics snapshot."""
+        """Get current statistics snapshot, merged across threads."""
         with self._stats_lock:
-            return TelemetryStats(
-                total_requests=self._stats.total_requests,
-                total_sleeps=self._stats.total_sleeps,
-                total_sleep_time=self._stats.total_sleep_time,
-                total_elapsed_time=self._stats.total_elapsed_time,
-                decisions_by_type=self._stats.decisions_by_type.copy(),
-                status_codes=self._stats.status_codes.copy(),
-            )
+            generation = self._stats_generation
+            thread_stats = list(self._thread_stats)
+        
+        # Only each counter's owning thread bumps its version, so no bump
+        # is lost and the sum grows with every event recorded since
+        version = (generation, sum([stats.version for stats in thread_stats]))
+        cache = self._stats_cache
+        if cache is None or cache[0] != version:
+            cache = (version, self._merge_stats(thread_stats))
+            self._stats_cache = cache
+        
+        # Hand out a copy so callers can't mutate the cached dicts
+        stats = cache[1]
+        return replace(
+            stats,
+            decisions_by_type=stats.decisions_by_type.copy(),
+            status_codes=stats.status_codes.copy(),
+        )
+    
+    def _merge_stats(self, thread_stats: List[_ThreadStats]) -> TelemetryStats:
+        """Sum the given per-thread counters into one TelemetryStats."""
+        merged = TelemetryStats()
+        decision_counts = [0] * len(_DECISION_VALUES)
+        status_counts = [0] * _STATUS_SLOTS
+        decisions = merged.decisions_by_type
+        statuses = merged.status_codes
+        for stats in thread_stats:
+            merged.total_requests += stats.total_requests
+            merged.total_sleeps += stats.total_sleeps
+            merged.total_sleep_time += stats.total_sleep_time
+            merged.total_elapsed_time += stats.total_elapsed_time
+            for i, count in enumerate(stats.decision_counts):
+                decision_counts[i] += count
+            for i, count in enumerate(stats.status_counts):
+                if count:
+                    status_counts[i] += count
+            # Copy first: the owning thread may be adding keys
+            for key, count in stats.other_decisions.copy().items():
+                decisions[key] = decisions.get(key, 0) + count
+            for key, count in stats.other_statuses.copy().items():
+                statuses[key] = statuses.get(key, 0) + count
+        
+        # Rebuild the dicts only for counters that were hit
+        for value, count in zip(_DECISION_VALUES, decision_counts):
+            if count:
+                decisions[value] = decisions.get(value, 0) + count
+        for status, count in enumerate(status_counts):
+            if count:
+                statuses[status] = statuses.get(status, 0) + count
+        
+        return merged
     
     def reset_stats(self) -> None:
         """Reset statistics."""
+        # Threads notice the new generation and start fresh stats
         with self._stats_lock:
-            self._stats = TelemetryStats()
+            self._stats_generation += 1
+            self._thread_stats = []
     
     def get_events(self) -> List[TelemetryEvent]:
-        """Get all recorded events (for testing)."""
+        """Get the most recent recorded events (for testing)."""
         with self._events_lock:
-            return self._events.copy()
+            return list(self._events)
     
     def clear_events(self) -> None:
         """Clear event history."""
@@ -240,24 +780,26 @@ class TelemetryRecorder:
 
 
 # [CTX:PBI-0:0-5:TELEM] Global telemetry recorder instance
-_global_recorder: Optional[TelemetryRecorder] = None
-_recorder_lock = threading.Lock()
+# Created eagerly so reads need no lock; rebinding a module global is atomic
+_global_recorder: TelemetryRecorder = TelemetryRecorder()
+
+# Per-context override (thread or asyncio task) installed by use_recorder()
+_context_recorder: ContextVar[Optional[TelemetryRecorder]] = ContextVar(
+    "telemetry_recorder", default=None
+)
 
 
 def get_recorder() -> TelemetryRecorder:
     """
-    Get the global telemetry recorder instance.
+    Get the active telemetry recorder.
     
-    Creates a default recorder if none exists.
+    Returns the recorder installed by use_recorder() in the current context,
+    otherwise the global one.
     """
-    global _global_recorder
-    
-    if _global_recorder is None:
-        with _recorder_lock:
-            if _global_recorder is None:
-                _global_recorder = TelemetryRecorder()
-    
-    return _global_recorder
+    recorder = _context_recorder.get()
+    if recorder is None:
+        return _global_recorder
+    return recorder
 
 
 def set_recorder(recorder: TelemetryRecorder) -> None:
@@ -269,8 +811,61 @@ def set_recorder(recorder: TelemetryRecorder) -> None:
     """
     global _global_recorder
     
-    with _recorder_lock:
-        _global_recorder = recorder
+    _global_recorder = recorder
+
+
+@contextmanager
+def use_recorder(recorder: TelemetryRecorder) -> Iterator[TelemetryRecorder]:
+    """
+    Use a recorder for the current context only.
+    
+    The override is visible to code running in this thread or asyncio task
+    (and tasks it creates) until the block exits; other threads and tasks
+    keep using the global recorder.
+    
+    Args:
+        recorder: Recorder instance to use within the block
+        
+    Yields:
+        The recorder
+    """
+    token = _context_recorder.set(recorder)
+    try:
+        yield recorder
+    finally:
+        _context_recorder.reset(token)
+
+
+# (whole second, "YYYY-MM-DDTHH:MM:SS") for the last formatted timestamp;
+# replaced as a single tuple, so threads can share it without a lock
+_ts_cache: Tuple[int, str] = (-1, "")
+
+
+def _format_timestamp(t: float) -> str:
+    """
+    Format a Unix time as an ISO 8601 UTC timestamp.
+    
+    Matches datetime.fromtimestamp(t, timezone.utc).isoformat(), but the
+    seconds part is only formatted once per second; events within the same
+    second just append their microsecond suffix.
+    """
+    global _ts_cache
+    
+    second = int(t)
+    # Round half to even like datetime, carrying into the next second
+    micros = round((t - second) * 1_000_000)
+    if micros >= 1_000_000:
+        second += 1
+        micros -= 1_000_000
+    
+    cached_second, prefix = _ts_cache
+    if second != cached_second:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+        _ts_cache = (second, prefix)
+    
+    if micros:
+        return f"{prefix}.{micros:06d}+00:00"
+    return f"{prefix}+00:00"
 
 
 def create_event(
@@ -280,7 +875,7 @@ def create_event(
     status: Optional[int] = None,
     elapsed_ms: float = 0.0,
     sleep_s: float = 0.0,
-    headers_seen: Optional[Dict[str, str]] = None,
+    headers_seen: Optional[Union[Mapping[str, str], HeaderPairs]] = None,
     bucket_key: str = "",
     attempt: int = 0,
     tokens_available: float = 0.0,
@@ -303,19 +898,23 @@ def create_event(
     Returns:
         TelemetryEvent ready for recording
     """
-    from datetime import datetime, timezone
+    try:
+        event = _event_pool.pop()
+    except IndexError:
+        event = TelemetryEvent.__new__(TelemetryEvent)
     
-    return TelemetryEvent(
-        timestamp=datetime.now(timezone.utc).isoformat(),
+    event.__init__(
+        timestamp=_format_timestamp(time.time()),
         exchange=exchange,
         endpoint=endpoint,
         status=status,
         elapsed_ms=elapsed_ms,
         decision=decision.value,
         sleep_s=sleep_s,
-        headers_seen=headers_seen or {},
+        headers_seen=_header_view(headers_seen),
         bucket_key=bucket_key,
         attempt=attempt,
         tokens_available=tokens_available,
     )
+    return event
 
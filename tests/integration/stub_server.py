@@ -11,12 +11,15 @@ Features:
 - Retry-After header support
 - Queue-based response configuration
 - Async operation for integration with pytest-asyncio
+- Optional UNIX domain socket transport to skip the loopback TCP stack
 """
 import asyncio
+import functools
+import itertools
 import logging
 from collections import deque
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional
 
 from aiohttp import web
 
@@ -24,9 +27,13 @@ logger = logging.getLogger(__name__)
 
 
 # [CTX:PBI-0:0-4:STUB] Response configuration
-@dataclass
+@dataclass(frozen=True)
 class StubResponse:
-    """Configuration for a single stub response."""
+    """
+    Configuration for a single stub response.
+    
+    Frozen so a single instance can safely occupy many queue slots.
+    """
     
     status: int = 200
     headers: Dict[str, str] = field(default_factory=dict)
@@ -68,18 +75,23 @@ class StubServer:
         self,
         host: str = "127.0.0.1",
         port: int = 8888,
-        default_response: Optional[StubResponse] = None
+        default_response: Optional[StubResponse] = None,
+        socket_path: Optional[str] = None
     ):
         """
         Initialize stub server.
         
         Args:
-            host: Host to bind to
-            port: Port to bind to
+            host: Host to bind to (and to report in URLs)
+            port: Port to bind to (and to report in URLs)
             default_response: Default response when queue is empty
+            socket_path: If set, listen on this UNIX domain socket instead
+                of TCP. URLs from get_url() keep the host:port form so
+                clients using a UnixConnector send the same Host header.
         """
         self.host = host
         self.port = port
+        self.socket_path = socket_path
         self.default_response = default_response or StubResponse(
             status=200,
             headers={
@@ -101,7 +113,7 @@ class StubServer:
         # Server state
         self._app: Optional[web.Application] = None
         self._runner: Optional[web.AppRunner] = None
-        self._site: Optional[web.TCPSite] = None
+        self._site: Optional[web.BaseSite] = None
     
     async def _handle_request(self, request: web.Request) -> web.Response:
         """
@@ -163,15 +175,35 @@ class StubServer:
             f"[CTX:PBI-0:0-4:STUB] Enqueued response: {response.to_dict()}"
         )
     
-    def enqueue_responses(self, responses: List[StubResponse]) -> None:
+    def enqueue_responses(self, responses: Iterable[StubResponse]) -> None:
         """
-        Add multiple responses to queue.
+        Add multiple responses to queue in a single extend.
         
         Args:
-            responses: List of response configurations
+            responses: Iterable of response configurations
         """
-        for response in responses:
-            self.enqueue_response(response)
+        before = len(self._response_queue)
+        self._response_queue.extend(responses)
+        logger.debug(
+            f"[CTX:PBI-0:0-4:STUB] Enqueued "
+            f"{len(self._response_queue) - before} responses"
+        )
+    
+    def enqueue_pattern(self, count: int, response: StubResponse) -> None:
+        """
+        Add the same response to the queue ``count`` times.
+        
+        The instance is shared across all slots, so long scripted sequences
+        (e.g. 50 successes, then 5 throttles) cost a single ``extend``.
+        
+        Args:
+            count: Number of times to serve the response
+            response: Response configuration to repeat
+        """
+        self._response_queue.extend(itertools.repeat(response, count))
+        logger.debug(
+            f"[CTX:PBI-0:0-4:STUB] Enqueued {count}x response: {response.status}"
+        )
     
     def clear_queue(self) -> None:
         """Clear response queue."""
@@ -184,6 +216,17 @@ class StubServer:
         self.request_history.clear()
         logger.debug("[CTX:PBI-0:0-4:STUB] Reset stats")
     
+    def make_app(self) -> web.Application:
+        """
+        Build the aiohttp application serving the response queue.
+        
+        Returns:
+            Application with a catch-all route bound to this server
+        """
+        app = web.Application()
+        app.router.add_route("*", "/{tail:.*}", self._handle_request)
+        return app
+    
     async def start(self) -> None:
         """Start the stub server."""
         if self._runner is not None:
@@ -191,21 +234,20 @@ class StubServer:
             return
         
         # Create application
-        self._app = web.Application()
-        
-        # Add catch-all route
-        self._app.router.add_route("*", "/{tail:.*}", self._handle_request)
+        self._app = self.make_app()
         
         # Start server
         self._runner = web.AppRunner(self._app)
         await self._runner.setup()
         
-        self._site = web.TCPSite(self._runner, self.host, self.port)
+        if self.socket_path is not None:
+            self._site = web.UnixSite(self._runner, self.socket_path)
+        else:
+            self._site = web.TCPSite(self._runner, self.host, self.port)
         await self._site.start()
         
         logger.info(
-            f"[CTX:PBI-0:0-4:STUB] Stub server started on "
-            f"http://{self.host}:{self.port}"
+            f"[CTX:PBI-0:0-4:STUB] Stub server started on {self._site.name}"
         )
     
     async def stop(self) -> None:
@@ -237,6 +279,9 @@ class StubServer:
 
 
 # [CTX:PBI-0:0-4:STUB] Helper functions for common scenarios
+# Factories are memoized: identical arguments return the same frozen
+# StubResponse, so callers must treat the returned headers as read-only.
+@functools.lru_cache(maxsize=256)
 def success_response(
     limit: int = 100,
     remaining: int = 99,
@@ -267,6 +312,7 @@ def success_response(
     )
 
 
+@functools.lru_cache(maxsize=256)
 def throttle_response(retry_after: int = 30, include_rate_headers: bool = False) -> StubResponse:
     """
     Create a 429 throttle response.
@@ -298,6 +344,7 @@ def throttle_response(retry_after: int = 30, include_rate_headers: bool = False)
     )
 
 
+@functools.lru_cache(maxsize=256)
 def error_response(status: int = 500) -> StubResponse:
     """
     Create a 5xx error response.
@@ -318,6 +365,7 @@ def error_response(status: int = 500) -> StubResponse:
     )
 
 
+@functools.lru_cache(maxsize=256)
 def exhausted_response(reset_offset: int = 30) -> StubResponse:
     """
     Create a 200 response indicating rate limit exhaustion.
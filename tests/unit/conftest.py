@@ -0,0 +1,23 @@
+"""
+Pytest configuration for unit tests.
+"""
+import pytest
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_collection_modifyitems(config, items):
+    """
+    Keep ``no_reorder`` tests first and in file order.
+    
+    Reordering plugins (cacheprovider's --ff, pytest-randomly) run inside
+    this wrapper; afterwards the marked items that survived deselection
+    are moved back to the front in their original collection order.
+    """
+    pinned = [item for item in items if item.get_closest_marker("no_reorder")]
+    result = yield
+    if pinned:
+        remaining = set(map(id, items))
+        pinned = [item for item in pinned if id(item) in remaining]
+        pinned_ids = set(map(id, pinned))
+        items[:] = pinned + [item for item in items if id(item) not in pinned_ids]
+    return result
@@ -6,13 +6,21 @@ Tests cover:
 - Fallback to defaults when config is missing
 - ExchangeConfig and LimitsConfig functionality
 """
+import dataclasses
+import os
+import sys
 import pytest
 from pathlib import Path
-import tempfile
 import yaml
 
+try:
+    from yaml import CSafeDumper as _YAML_DUMPER
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeDumper as _YAML_DUMPER
+
 from pred_mkts.core.config import (
     ConfigValidationError,
+    clear_config_cache,
     ExchangeConfig,
     LimitsConfig,
     load_config,
@@ -22,6 +30,32 @@ from pred_mkts.core.config import (
 )
 
 
+@pytest.fixture(scope="session")
+def yaml_file_factory(tmp_path_factory):
+    """
+    Provide a factory writing config payloads to files, once per payload.
+    
+    Dicts are serialized with yaml.dump; strings are written verbatim (for
+    malformed YAML). Identical payloads return the same path.
+    """
+    base = tmp_path_factory.mktemp("configs")
+    paths = {}
+    
+    def make(data):
+        key = repr(data)
+        path = paths.get(key)
+        if path is None:
+            path = base / f"config_{len(paths)}.yml"
+            if isinstance(data, str):
+                path.write_text(data)
+            else:
+                path.write_text(yaml.dump(data, Dumper=_YAML_DUMPER))
+            paths[key] = path
+        return path
+    
+    return make
+
+
 class TestExchangeConfig:
     """Test ExchangeConfig class."""
     
@@ -39,7 +73,7 @@ class TestExchangeConfig:
             "remaining": "X-RateLimit-Remaining",
             "reset": "X-RateLimit-Reset",
         }
-        assert config.buckets == []
+        assert config.buckets == ()
     
     def test_create_with_custom_values(self):
         """Test creating ExchangeConfig with custom values."""
@@ -60,7 +94,7 @@ class TestExchangeConfig:
         assert config.burst == 10
         assert config.max_concurrency == 2
         assert config.headers == custom_headers
-        assert config.buckets == custom_buckets
+        assert config.buckets == tuple(custom_buckets)
     
     def test_from_dict(self):
         """Test creating ExchangeConfig from dictionary."""
@@ -80,7 +114,19 @@ class TestExchangeConfig:
         assert config.burst == 30
         assert config.max_concurrency == 8
         assert config.headers == {"retry_after": "Retry"}
-        assert config.buckets == [{"key": "global"}]
+        assert config.buckets == ({"key": "global"},)
+    
+    def test_from_dict_interns_strings(self):
+        """Test host and header strings from dicts are interned."""
+        name = "".join(["Retry", "-After"])
+        config = ExchangeConfig.from_dict({
+            "host": "".join(["api.", "intern.com"]),
+            "headers": {"retry_after": name, "limit": 100}
+        })
+        
+        assert config.host is sys.intern("api.intern.com")
+        assert config.headers["retry_after"] is sys.intern("Retry-After")
+        assert config.headers["limit"] == 100
     
     def test_from_dict_with_missing_fields(self):
         """Test from_dict uses defaults for missing fields."""
@@ -91,6 +137,54 @@ class TestExchangeConfig:
         assert config.steady_rate == 10
         assert config.burst == 20
     
+    def test_is_frozen(self):
+        """Test ExchangeConfig fields cannot be reassigned."""
+        config = ExchangeConfig(host="api.test.com")
+        
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.steady_rate = 5
+    
+    def test_contents_are_read_only(self):
+        """Test shared configs can't be changed through their containers."""
+        config = ExchangeConfig(
+            host="api.test.com",
+            headers={"retry_after": "Retry-After"},
+            buckets=[{"key": "orders", "share_with": ["markets"]}],
+        )
+        limits = LimitsConfig(exchanges={"test": config})
+        
+        with pytest.raises(TypeError):
+            config.headers["retry_after"] = "X-Retry"
+        with pytest.raises(TypeError):
+            config.buckets[0]["key"] = "other"
+        with pytest.raises(TypeError):
+            limits.exchanges["other"] = config
+        assert config.buckets[0]["share_with"] == ("markets",)
+        
+        # Serialization hands out plain, independent containers
+        data = limits.to_dict()
+        data["exchanges"]["test"]["buckets"][0]["share_with"].append("orders")
+        assert data["exchanges"]["test"]["buckets"] == [
+            {"key": "orders", "share_with": ["markets", "orders"]}
+        ]
+        assert config.buckets[0]["share_with"] == ("markets",)
+    
+    def test_default_config_is_read_only(self):
+        """Test the cached default config can't be mutated by one caller."""
+        default = get_default_config().exchanges["default"]
+        
+        with pytest.raises(TypeError):
+            default.headers["retry_after"] = "X-Retry"
+        assert get_default_config().exchanges["default"].headers["retry_after"] == "Retry-After"
+    
+    def test_hashable_by_identity(self):
+        """Test configs with list/dict fields can be set members and dict keys."""
+        config = ExchangeConfig(host="api.test.com", buckets=[{"key": "all"}])
+        limits = LimitsConfig(exchanges={"test": config})
+        
+        assert {config, limits} == {config, limits}
+        assert config != ExchangeConfig(host="api.test.com", buckets=[{"key": "all"}])
+    
     def test_to_dict(self):
         """Test converting ExchangeConfig to dictionary."""
         config = ExchangeConfig(
@@ -315,7 +409,7 @@ class TestValidateConfig:
 class TestLoadConfig:
     """Test configuration loading."""
     
-    def test_load_valid_config_file(self):
+    def test_load_valid_config_file(self, yaml_file_factory):
         """Test loading a valid config file."""
         config_data = {
             "exchanges": {
@@ -341,29 +435,22 @@ class TestLoadConfig:
             }
         }
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yml', delete=False) as f:
-            yaml.dump(config_data, f)
-            temp_path = Path(f.name)
-        
-        try:
-            config = load_config(temp_path)
-            
-            assert len(config.exchanges) == 1
-            assert "polymarket" in config.exchanges
-            
-            poly_config = config.exchanges["polymarket"]
-            assert poly_config.host == "api.polymarket.com"
-            assert poly_config.steady_rate == 10
-            assert poly_config.burst == 20
-            assert poly_config.max_concurrency == 4
-            assert len(poly_config.buckets) == 1
-            assert poly_config.buckets[0]["key"] == "global"
-        finally:
-            temp_path.unlink()
-    
-    def test_load_missing_file_returns_default(self):
+        config = load_config(yaml_file_factory(config_data))
+        
+        assert len(config.exchanges) == 1
+        assert "polymarket" in config.exchanges
+        
+        poly_config = config.exchanges["polymarket"]
+        assert poly_config.host == "api.polymarket.com"
+        assert poly_config.steady_rate == 10
+        assert poly_config.burst == 20
+        assert poly_config.max_concurrency == 4
+        assert len(poly_config.buckets) == 1
+        assert poly_config.buckets[0]["key"] == "global"
+    
+    def test_load_missing_file_returns_default(self, tmp_path):
         """Test loading non-existent file returns default config."""
-        non_existent_path = Path("/tmp/nonexistent_config_file_123456.yml")
+        non_existent_path = tmp_path / "missing.yml"
         
         config = load_config(non_existent_path)
         
@@ -372,19 +459,19 @@ class TestLoadConfig:
         default = get_default_config()
         assert len(config.exchanges) == len(default.exchanges)
     
-    def test_load_invalid_yaml(self):
+    def test_load_invalid_yaml(self, yaml_file_factory):
         """Test loading invalid YAML raises error."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yml', delete=False) as f:
-            f.write("invalid: yaml: content:\n  - bad indentation")
-            temp_path = Path(f.name)
+        path = yaml_file_factory("invalid: yaml: content:\n  - bad indentation")
         
-        try:
-            with pytest.raises(ConfigValidationError, match="Invalid YAML"):
-                load_config(temp_path)
-        finally:
-            temp_path.unlink()
+        with pytest.raises(ConfigValidationError, match="Invalid YAML"):
+            load_config(path)
+    
+    def test_load_empty_file(self, yaml_file_factory):
+        """Test loading a blank config file raises a validation error."""
+        with pytest.raises(ConfigValidationError, match="must be a dictionary"):
+            load_config(yaml_file_factory("  \n"))
     
-    def test_load_invalid_structure(self):
+    def test_load_invalid_structure(self, yaml_file_factory):
         """Test loading config with invalid structure raises error."""
         config_data = {
             "wrong_key": {
@@ -392,15 +479,96 @@ class TestLoadConfig:
             }
         }
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yml', delete=False) as f:
-            yaml.dump(config_data, f)
-            temp_path = Path(f.name)
+        with pytest.raises(ConfigValidationError, match="must contain 'exchanges'"):
+            load_config(yaml_file_factory(config_data))
+    
+    def test_load_is_cached_until_file_changes(self, tmp_path):
+        """Test repeated loads reuse the parsed config until the file changes."""
+        path = tmp_path / "limits.yml"
+        path.write_text("exchanges:\n  a:\n    host: api.a.com\n")
+        
+        first = load_config(path)
+        assert load_config(path) is first
+        
+        path.write_text("exchanges:\n  b:\n    host: api.bbbb.com\n")
+        second = load_config(path)
+        assert second is not first
+        assert "b" in second.exchanges
+    
+    def test_clear_config_cache(self, tmp_path):
+        """Test clearing the cache forces a reparse."""
+        path = tmp_path / "limits.yml"
+        path.write_text("exchanges:\n  a:\n    host: api.a.com\n")
+        
+        first = load_config(path)
+        clear_config_cache()
+        assert load_config(path) is not first
+    
+    def test_load_and_validate(self, yaml_file_factory):
+        """Test a loaded config is marked validated and re-validation is a no-op."""
+        config = load_config(yaml_file_factory({
+            "exchanges": {"test": {"host": "api.test.com"}}
+        }))
         
-        try:
-            with pytest.raises(ConfigValidationError, match="must contain 'exchanges'"):
-                load_config(temp_path)
-        finally:
-            temp_path.unlink()
+        assert config._validated
+        validate_config(config)
+    
+    def test_validate_unloaded_limits_config(self):
+        """Test a hand-built LimitsConfig is validated via its dict form."""
+        config = LimitsConfig(exchanges={
+            "test": ExchangeConfig(host="api.test.com", steady_rate=-1)
+        })
+        
+        assert not config._validated
+        with pytest.raises(ConfigValidationError, match="must be a positive number"):
+            validate_config(config)
+    
+    def test_load_prefers_fresh_json_sibling(self, tmp_path, caplog):
+        """Test a JSON sibling at least as new as the YAML file is used."""
+        yml_path = tmp_path / "limits.yml"
+        json_path = tmp_path / "limits.json"
+        yml_path.write_text("exchanges:\n  yaml:\n    host: api.yaml.com\n")
+        json_path.write_text('{"exchanges": {"json": {"host": "api.json.com"}}}')
+        
+        with caplog.at_level("DEBUG", logger="pred_mkts.core.config"):
+            config = load_config(yml_path)
+        
+        assert list(config.exchanges) == ["json"]
+        assert str(json_path) in caplog.text
+    
+    def test_load_unreadable_json_sibling_falls_back(self, tmp_path, monkeypatch, caplog):
+        """Test a JSON sibling that cannot be read falls back to the YAML file."""
+        yml_path = tmp_path / "limits.yml"
+        json_path = tmp_path / "limits.json"
+        yml_path.write_text("exchanges:\n  yaml:\n    host: api.yaml.com\n")
+        json_path.write_text('{"exchanges": {"json": {"host": "api.json.com"}}}')
+        
+        read_bytes = Path.read_bytes
+        
+        def fake_read_bytes(path):
+            if path.suffix == ".json":
+                raise PermissionError(13, "Permission denied", str(path))
+            return read_bytes(path)
+        
+        monkeypatch.setattr(Path, "read_bytes", fake_read_bytes)
+        with caplog.at_level("WARNING", logger="pred_mkts.core.config"):
+            config = load_config(yml_path)
+        
+        assert list(config.exchanges) == ["yaml"]
+        assert "Cannot read" in caplog.text
+    
+    def test_load_ignores_stale_json_sibling(self, tmp_path):
+        """Test a JSON sibling older than the YAML file is ignored."""
+        yml_path = tmp_path / "limits.yml"
+        json_path = tmp_path / "limits.json"
+        json_path.write_text('{"exchanges": {"json": {"host": "api.json.com"}}}')
+        yml_path.write_text("exchanges:\n  yaml:\n    host: api.yaml.com\n")
+        stat = yml_path.stat()
+        os.utime(json_path, ns=(stat.st_atime_ns, stat.st_mtime_ns - 10**9))
+        
+        config = load_config(yml_path)
+        
+        assert list(config.exchanges) == ["yaml"]
     
     def test_load_default_location(self):
         """Test loading from default location."""
@@ -426,4 +594,8 @@ class TestGetDefaultConfig:
         assert default_exchange.steady_rate == 10
         assert default_exchange.burst == 20
         assert default_exchange.max_concurrency == 4
-
+    
+    def test_get_default_config_is_cached(self, tmp_path):
+        """Test default configuration is built once and shared."""
+        assert get_default_config() is get_default_config()
+        assert load_config(tmp_path / "missing.yml") is get_default_config()
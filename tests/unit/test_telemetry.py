@@ -10,10 +10,12 @@ Tests verify:
 - Event history for testing
 """
 import json
+import logging
 import pytest
 import threading
 import time
 
+from pred_mkts.core import telemetry as telemetry_module
 from pred_mkts.core.telemetry import (
     TelemetryDecision,
     TelemetryEvent,
@@ -23,6 +25,7 @@ from pred_mkts.core.telemetry import (
     create_event,
     get_recorder,
     set_recorder,
+    use_recorder,
 )
 
 
@@ -71,12 +74,72 @@ class TestTelemetryEvent:
             decision="allow",
         )
         
-        result = event.to_json()
-        parsed = json.loads(result)
+        # One round trip checks the encoding; fields are checked on to_dict()
+        assert json.loads(event.to_json()) == event.to_dict()
+    
+    def test_event_serialized(self):
+        """Test serialized() returns matching JSON bytes and dict."""
+        event = TelemetryEvent(
+            timestamp="2025-10-15T09:05:00.123Z",
+            exchange="api.polymarket.com",
+            endpoint="/markets",
+            status=429,
+            elapsed_ms=234.5,
+            decision="backoff_429",
+            headers_seen={"Retry-After": "60"},
+        )
+        
+        raw, data = event.serialized()
+        
+        assert data == event.to_dict()
+        assert data["decision"] == "backoff_429"
+        assert json.loads(raw) == data
+    
+    @pytest.mark.parametrize("encoder", ["orjson", "stdlib"])
+    def test_event_to_json_bytes(self, encoder, monkeypatch):
+        """Test JSON encoding with and without orjson."""
+        if encoder == "stdlib":
+            monkeypatch.setattr(telemetry_module, "orjson", None)
+        elif telemetry_module.orjson is None:
+            pytest.skip("orjson not installed")
+        
+        event = TelemetryEvent(
+            timestamp="2025-10-15T09:05:00.123Z",
+            exchange="api.polymarket.com",
+            endpoint="/markets",
+            status=None,
+            elapsed_ms=234.5,
+            decision="allow",
+            headers_seen={"X-RateLimit-Remaining": "95"},
+        )
+        
+        assert json.loads(event.to_json_bytes()) == event.to_dict()
+        assert json.loads(event.to_json()) == event.to_dict()
+    
+    @pytest.mark.parametrize("encoder", ["orjson", "stdlib"])
+    def test_event_to_json_format(self, encoder, monkeypatch):
+        """Test both encoders write the same compact JSON, NaN as null."""
+        if encoder == "stdlib":
+            monkeypatch.setattr(telemetry_module, "orjson", None)
+        elif telemetry_module.orjson is None:
+            pytest.skip("orjson not installed")
         
-        assert parsed["timestamp"] == "2025-10-15T09:05:00.123Z"
-        assert parsed["exchange"] == "api.polymarket.com"
-        assert parsed["decision"] == "allow"
+        event = TelemetryEvent(
+            timestamp="2025-10-15T09:05:00.123Z",
+            exchange="api.polymarket.com",
+            endpoint="/märkte",
+            status=200,
+            elapsed_ms=float("nan"),
+            decision="allow",
+            headers_seen={"Retry-After": "1"},
+        )
+        
+        assert event.to_json() == (
+            '{"timestamp":"2025-10-15T09:05:00.123Z","exchange":"api.polymarket.com",'
+            '"endpoint":"/märkte","status":200,"elapsed_ms":null,"decision":"allow",'
+            '"sleep_s":0.0,"headers_seen":{"Retry-After":"1"},"bucket_key":"",'
+            '"attempt":0,"tokens_available":0.0}'
+        )
     
     def test_event_to_keyvalue(self):
         """Test event serialization to key=value format."""
@@ -100,6 +163,27 @@ class TestTelemetryEvent:
         # Nested dict should be flattened
         assert "headers_seen.X-RateLimit-Remaining=95" in result
     
+    def test_event_to_keyvalue_exact(self):
+        """Test key=value output keeps field order and None handling."""
+        event = TelemetryEvent(
+            timestamp="2025-10-15T09:05:00.123Z",
+            exchange="api.polymarket.com",
+            endpoint="/markets",
+            status=None,
+            elapsed_ms=0.0,
+            decision="throttle",
+            sleep_s=1.5,
+            headers_seen={"Retry-After": "1", "X-RateLimit-Remaining": "0"},
+            bucket_key=None,
+        )
+        
+        assert event.to_keyvalue() == (
+            "timestamp=2025-10-15T09:05:00.123Z exchange=api.polymarket.com "
+            "endpoint=/markets status=None elapsed_ms=0.0 decision=throttle "
+            "sleep_s=1.5 headers_seen.Retry-After=1 "
+            "headers_seen.X-RateLimit-Remaining=0 attempt=0 tokens_available=0.0"
+        )
+    
     def test_event_with_none_status(self):
         """Test event with null status (pre-request event)."""
         event = TelemetryEvent(
@@ -183,6 +267,127 @@ class TestTelemetryRecorder:
         assert recorder.format_json is False
         assert recorder.collect_stats is True
     
+    def test_recorder_enabled_for(self, caplog):
+        """Test enabled_for follows stats, history and logger level."""
+        recorder = TelemetryRecorder(keep_events=False)
+        
+        caplog.set_level(logging.INFO, logger="pred_mkts.core.telemetry")
+        assert recorder.enabled_for(TelemetryLevel.INFO)
+        assert not recorder.enabled_for(TelemetryLevel.DEBUG)
+        
+        caplog.set_level(logging.WARNING, logger="pred_mkts.core.telemetry")
+        assert not recorder.enabled_for(TelemetryLevel.INFO)
+        assert TelemetryRecorder(collect_stats=True, keep_events=False).enabled_for(
+            TelemetryLevel.DEBUG
+        )
+        assert TelemetryRecorder().enabled_for(TelemetryLevel.DEBUG)
+    
+    def test_recorder_wire_format(self):
+        """Test encode() follows the configured wire format."""
+        event = create_event(
+            exchange="polymarket",
+            endpoint="/markets",
+            decision=TelemetryDecision.ALLOW,
+            status=200,
+        )
+        
+        assert json.loads(TelemetryRecorder().encode(event)) == event.to_dict()
+        with pytest.raises(ValueError):
+            TelemetryRecorder(wire_format="xml")
+    
+    def test_recorder_wire_format_msgpack(self):
+        """Test MessagePack encoding round-trips the event dict."""
+        msgpack = pytest.importorskip("msgpack")
+        event = create_event(
+            exchange="polymarket",
+            endpoint="/markets",
+            decision=TelemetryDecision.BACKOFF_429,
+            status=429,
+            headers_seen={"Retry-After": "60"},
+        )
+        
+        packed = TelemetryRecorder(wire_format="msgpack").encode(event)
+        
+        assert msgpack.unpackb(packed) == event.to_dict()
+    
+    def test_recorder_writes_to_sink(self):
+        """Test events are exported in batches by the writer thread."""
+        import io
+        
+        sink = io.BytesIO()
+        recorder = TelemetryRecorder(keep_events=False, sink=sink)
+        
+        recorder.record(create_event(
+            exchange="polymarket",
+            endpoint="/markets/0",
+            decision=TelemetryDecision.ALLOW,
+        ))
+        recorder.record_many([
+            create_event(
+                exchange="polymarket",
+                endpoint=f"/markets/{i}",
+                decision=TelemetryDecision.THROTTLE,
+                sleep_s=0.5,
+            )
+            for i in range(1, 3)
+        ])
+        
+        assert recorder.flush(timeout=1.0)
+        lines = sink.getvalue().splitlines()
+        assert [json.loads(line)["endpoint"] for line in lines] == [
+            "/markets/0", "/markets/1", "/markets/2",
+        ]
+        
+        recorder.close(timeout=1.0)
+        assert not recorder._writer.is_alive()
+        assert recorder.flush() is True
+    
+    def test_recorder_context_manager_closes_sink(self):
+        """Test leaving the with block flushes and stops the writer."""
+        import io
+        
+        sink = io.BytesIO()
+        with TelemetryRecorder(keep_events=False, sink=sink) as recorder:
+            assert recorder in telemetry_module._open_recorders
+            recorder.record(create_event(
+                exchange="polymarket",
+                endpoint="/markets",
+                decision=TelemetryDecision.ALLOW,
+            ))
+        
+        assert not recorder._writer.is_alive()
+        assert recorder not in telemetry_module._open_recorders
+        assert json.loads(sink.getvalue())["endpoint"] == "/markets"
+    
+    def test_recorder_close_timeout_keeps_writer(self):
+        """Test a close() that times out leaves the recorder closable."""
+        import io
+        
+        release = threading.Event()
+        
+        class SlowSink(io.BytesIO):
+            def write(self, data):
+                release.wait(timeout=5.0)
+                return super().write(data)
+        
+        sink = SlowSink()
+        recorder = TelemetryRecorder(keep_events=False, sink=sink)
+        recorder.record(create_event(
+            exchange="polymarket",
+            endpoint="/markets",
+            decision=TelemetryDecision.ALLOW,
+        ))
+        
+        recorder.close(timeout=0.01)
+        assert recorder._writer.is_alive()
+        assert recorder._sink_queue is not None
+        
+        release.set()
+        recorder.close(timeout=5.0)
+        assert not recorder._writer.is_alive()
+        assert recorder._sink_queue is None
+        assert json.loads(sink.getvalue())["endpoint"] == "/markets"
+    
     def test_recorder_collects_stats(self):
         """Test statistics collection enabled."""
         recorder = TelemetryRecorder(collect_stats=True)
@@ -234,6 +439,70 @@ class TestTelemetryRecorder:
         assert stats.status_codes[200] == 2
         assert stats.status_codes[429] == 1
     
+    def test_recorder_stats_unusual_values(self):
+        """Test decisions and status codes outside the counter arrays."""
+        recorder = TelemetryRecorder(collect_stats=True)
+        
+        for decision, status in [("custom", 999), ("allow", 200), ("custom", 599)]:
+            recorder.record(TelemetryEvent(
+                timestamp="2025-10-15T09:05:00Z",
+                exchange="polymarket",
+                endpoint="/markets",
+                status=status,
+                elapsed_ms=0.0,
+                decision=decision,
+            ))
+        
+        stats = recorder.get_stats()
+        assert stats.decisions_by_type == {"allow": 1, "custom": 2}
+        assert stats.status_codes == {200: 1, 599: 1, 999: 1}
+    
+    def test_recorder_stats_cached_between_records(self, monkeypatch):
+        """Test merged stats are reused until the next record."""
+        recorder = TelemetryRecorder(collect_stats=True)
+        event = create_event(
+            exchange="polymarket",
+            endpoint="/markets",
+            decision=TelemetryDecision.ALLOW,
+            status=200,
+        )
+        recorder.record(event)
+        
+        merges = []
+        merge = recorder._merge_stats
+        monkeypatch.setattr(
+            recorder, "_merge_stats", lambda thread_stats: merges.append(1) or merge(thread_stats)
+        )
+        
+        first = recorder.get_stats()
+        first.status_codes[200] = 99
+        assert recorder.get_stats().status_codes == {200: 1}
+        assert len(merges) == 1
+        
+        recorder.record(event)
+        assert recorder.get_stats().status_codes == {200: 2}
+        recorder.reset_stats()
+        assert recorder.get_stats().total_requests == 0
+        assert len(merges) == 3
+    
+    def test_recorder_stats_cache_sees_other_threads(self):
+        """Test a record() on another thread invalidates the cached merge."""
+        recorder = TelemetryRecorder(collect_stats=True)
+        event = create_event(
+            exchange="polymarket",
+            endpoint="/markets",
+            decision=TelemetryDecision.ALLOW,
+            status=200,
+        )
+        recorder.record(event)
+        assert recorder.get_stats().total_requests == 1
+        
+        worker = threading.Thread(target=recorder.record, args=(event,))
+        worker.start()
+        worker.join()
+        
+        assert recorder.get_stats().total_requests == 2
+    
     def test_recorder_event_history(self):
         """Test event history tracking."""
         recorder = TelemetryRecorder()
@@ -260,6 +529,20 @@ class TestTelemetryRecorder:
         assert events[0].exchange == "polymarket"
         assert events[1].exchange == "kalshi"
     
+    def test_recorder_event_history_bounded(self):
+        """Test event history keeps only the newest events."""
+        recorder = TelemetryRecorder(history_max=3)
+        
+        for i in range(5):
+            recorder.record(create_event(
+                exchange="polymarket",
+                endpoint=f"/markets/{i}",
+                decision=TelemetryDecision.ALLOW,
+            ))
+        
+        events = recorder.get_events()
+        assert [e.endpoint for e in events] == ["/markets/2", "/markets/3", "/markets/4"]
+    
     def test_recorder_reset_stats(self):
         """Test statistics reset."""
         recorder = TelemetryRecorder(collect_stats=True)
@@ -295,6 +578,32 @@ class TestTelemetryRecorder:
         recorder.clear_events()
         assert len(recorder.get_events()) == 0
     
+    def test_recorder_recycles_events(self):
+        """Test events are pooled when history is off."""
+        recorder = TelemetryRecorder(collect_stats=True, keep_events=False)
+        
+        event = create_event(
+            exchange="polymarket",
+            endpoint="/markets",
+            decision=TelemetryDecision.THROTTLE,
+            sleep_s=1.0,
+            headers_seen={"Retry-After": "1"},
+        )
+        recorder.record(event)
+        
+        assert recorder.get_events() == []
+        assert recorder.get_stats().total_sleeps == 1
+        
+        reused = create_event(
+            exchange="kalshi",
+            endpoint="/events",
+            decision=TelemetryDecision.ALLOW,
+        )
+        assert reused is event
+        assert reused.exchange == "kalshi"
+        assert reused.sleep_s == 0.0
+        assert reused.headers_seen == {}
+    
     def test_recorder_thread_safety(self):
         """Test concurrent recording from multiple threads."""
         recorder = TelemetryRecorder(collect_stats=True)
@@ -325,6 +634,71 @@ class TestTelemetryRecorder:
         # Should have 100 total events
         assert stats.total_requests == 100
         assert len(events) == 100
+    
+    def test_recorder_record_many_thread_safety(self):
+        """Test concurrent batched recording from multiple threads."""
+        recorder = TelemetryRecorder(collect_stats=True)
+        
+        def record_batch(count: int):
+            recorder.record_many([
+                create_event(
+                    exchange="polymarket",
+                    endpoint=f"/markets/{i}",
+                    decision=TelemetryDecision.THROTTLE,
+                    elapsed_ms=100.0,
+                    sleep_s=0.5,
+                    status=200,
+                )
+                for i in range(count)
+            ])
+        
+        threads = [
+            threading.Thread(target=record_batch, args=(10,)) for _ in range(10)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        
+        stats = recorder.get_stats()
+        assert stats.total_requests == 100
+        assert stats.total_sleeps == 100
+        assert stats.total_sleep_time == 50.0
+        assert stats.total_elapsed_time == 10000.0
+        assert stats.decisions_by_type == {"throttle": 100}
+        assert stats.status_codes == {200: 100}
+        assert len(recorder.get_events()) == 100
+    
+    def test_recorder_merges_thread_stats(self):
+        """Test per-thread statistics merge and reset together."""
+        recorder = TelemetryRecorder(collect_stats=True)
+        
+        def record(decision: TelemetryDecision, status: int):
+            recorder.record(create_event(
+                exchange="polymarket",
+                endpoint="/markets",
+                decision=decision,
+                status=status,
+            ))
+        
+        record(TelemetryDecision.ALLOW, 200)
+        worker = threading.Thread(
+            target=record, args=(TelemetryDecision.BACKOFF_429, 429)
+        )
+        worker.start()
+        worker.join()
+        
+        stats = recorder.get_stats()
+        assert stats.total_requests == 2
+        assert stats.decisions_by_type == {"allow": 1, "backoff_429": 1}
+        assert stats.status_codes == {200: 1, 429: 1}
+        
+        recorder.reset_stats()
+        record(TelemetryDecision.ALLOW, 200)
+        
+        stats = recorder.get_stats()
+        assert stats.total_requests == 1
+        assert stats.status_codes == {200: 1}
 
 
 # [CTX:PBI-0:0-5:TELEM] Test helper functions
@@ -345,6 +719,21 @@ class TestHelperFunctions:
         # Accept both Z suffix and +00:00 timezone format
         assert ("Z" in event.timestamp or "+00:00" in event.timestamp)
     
+    def test_format_timestamp(self):
+        """Test cached timestamp formatting across second boundaries."""
+        from pred_mkts.core.telemetry import _format_timestamp
+        
+        from datetime import datetime, timezone
+        
+        assert _format_timestamp(1760519100.123) == "2025-10-15T09:05:00.123000+00:00"
+        assert _format_timestamp(1760519101.0) == "2025-10-15T09:05:01+00:00"
+        assert _format_timestamp(1760519100.9999996) == "2025-10-15T09:05:01+00:00"
+        
+        # Same output as the datetime.isoformat() it replaces
+        for t in (1760519100.5, 1760519100.0000005, 1760519100.1234565, 1760519159.999999):
+            expected = datetime.fromtimestamp(t, timezone.utc).isoformat()
+            assert _format_timestamp(t) == expected
+    
     def test_create_event_all_fields(self):
         """Test create_event with all optional fields."""
         event = create_event(
@@ -371,6 +760,30 @@ class TestHelperFunctions:
         assert event.attempt == 1
         assert event.tokens_available == 10.5
     
+    def test_create_event_freezes_headers(self):
+        """Test headers are stored as a read-only mapping with interned names."""
+        name = "".join(["X-RateLimit-", "Remaining"])
+        first = create_event(
+            exchange="polymarket",
+            endpoint="/markets",
+            decision=TelemetryDecision.ADAPTIVE,
+            headers_seen={name: "95"},
+        )
+        second = create_event(
+            exchange="polymarket",
+            endpoint="/markets",
+            decision=TelemetryDecision.ADAPTIVE,
+            headers_seen={"".join(["X-RateLimit-", "Remaining"]): "94"},
+        )
+        
+        assert first.headers_seen == {"X-RateLimit-Remaining": "95"}
+        assert first.headers_seen["X-RateLimit-Remaining"] == "95"
+        assert first.headers_seen.get("Retry-After") is None
+        assert next(iter(first.headers_seen)) is next(iter(second.headers_seen))
+        with pytest.raises(TypeError):
+            first.headers_seen["Retry-After"] = "1"
+        assert first.to_dict()["headers_seen"] == {"X-RateLimit-Remaining": "95"}
+    
     def test_get_recorder_singleton(self):
         """Test get_recorder returns singleton instance."""
         recorder1 = get_recorder()
@@ -394,6 +807,23 @@ class TestHelperFunctions:
         
         # Reset to default for other tests
         set_recorder(TelemetryRecorder())
+    
+    def test_use_recorder_is_context_local(self):
+        """Test use_recorder overrides only the current context."""
+        global_recorder = get_recorder()
+        local_recorder = TelemetryRecorder()
+        seen_in_thread = []
+        
+        with use_recorder(local_recorder):
+            assert get_recorder() is local_recorder
+            
+            # New threads start from an empty context
+            t = threading.Thread(target=lambda: seen_in_thread.append(get_recorder()))
+            t.start()
+            t.join()
+        
+        assert seen_in_thread == [global_recorder]
+        assert get_recorder() is global_recorder
 
 
 # [CTX:PBI-0:0-5:TELEM] Test decision types
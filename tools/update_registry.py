@@ -6,14 +6,26 @@ Writes docs/delivery/registry.yml as:
 - docs: important doc paths
 Extend later if you want logical module names.
 """
+import os
 from pathlib import Path
 import yaml
 
-src = Path("src")
-code_paths = []
-if src.exists():
-    for p in src.rglob("*.py"):
-        code_paths.append(str(p.as_posix()))
+
+def walk_py(root):
+    """Collect .py paths under root as posix strings, without Path objects."""
+    out = []
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".py"):
+                    out.append(entry.path.replace(os.sep, "/"))
+    return out
+
+
+code_paths = walk_py("src") if os.path.isdir("src") else []
 code_paths.sort()
 
 reg = {
@@ -30,5 +42,12 @@ reg = {
 
 out = Path("docs/delivery/registry.yml")
 out.parent.mkdir(parents=True, exist_ok=True)
-out.write_text(yaml.safe_dump(reg, sort_keys=False), encoding="utf-8")
-print("registry.yml updated; files:", len(code_paths))
+# libyaml's C emitter when PyYAML was built with it, else the pure-Python one
+Dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+new = yaml.dump(reg, Dumper=Dumper, sort_keys=False).encode("utf-8")
+# Leave the file (and its mtime) alone when nothing changed
+if out.exists() and out.read_bytes() == new:
+    print("registry.yml unchanged; files:", len(code_paths))
+else:
+    out.write_bytes(new)
+    print("registry.yml updated; files:", len(code_paths))
@@ -1,20 +1,28 @@
 
 """
-Set ACTIVE_PBI / ACTIVE_TASKS below when you switch tasks.
-This script renders docs/delivery/_state.md automatically via pre-commit.
+Set the active PBI / tasks in pyproject.toml under [tool.pred_mkts.state]
+when you switch tasks. This script renders docs/delivery/_state.md
+automatically via pre-commit.
 """
 from pathlib import Path
+import tomllib
 
-# ---- EDIT THESE WHEN YOU SWITCH TASKS ----
-ACTIVE_PBI = "0"          # e.g., "1"
-ACTIVE_TASKS = ["0-5"]        # e.g., ["1-2"]
-touchpoints = ["config/limits.yml", "src/pred_mkts/core/config.py", "tests/unit/test_config.py"]         # e.g., ["src/app/config.py"]
-# ------------------------------------------
+state = tomllib.loads(Path("pyproject.toml").read_text(encoding="utf-8"))
+state = state.get("tool", {}).get("pred_mkts", {}).get("state", {})
+ACTIVE_PBI = state.get("active_pbi", "")
+ACTIVE_TASKS = state.get("active_tasks", [])
+touchpoints = state.get("touchpoints", [])
 
 content = f"""# Project State (manual, short)
 - **Active PBI**: {("(none)" if not ACTIVE_PBI else f"PBI-{ACTIVE_PBI} (docs/delivery/{ACTIVE_PBI}/prd.md)")}
 - **Active Task(s)**: {("(none)" if not ACTIVE_TASKS else ", ".join(ACTIVE_TASKS))}
 - **Code Touchpoints**: {("(none)" if not touchpoints else ", ".join(touchpoints))}
 """
-Path("docs/delivery/_state.md").write_text(content, encoding="utf-8")
-print("_state.md updated")
+out = Path("docs/delivery/_state.md")
+new = content.encode("utf-8")
+# Leave the file (and its mtime) alone when nothing changed
+if out.exists() and out.read_bytes() == new:
+    print("_state.md unchanged")
+else:
+    out.write_bytes(new)
+    print("_state.md updated")